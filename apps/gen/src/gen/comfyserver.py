@@ -15,6 +15,9 @@ class comfyServer(QWebSocket):
         self._client_id = str(uuid.uuid4())
         self._connected = False
 
+        # Shared HTTP pool so repeated requests reuse the server connection
+        self._http = urllib3.PoolManager()
+
         # Store messages for processing
         self._message_queue = []
 
@@ -73,7 +76,7 @@ class comfyServer(QWebSocket):
         p = {"prompt": job.get_workflow_for_submission(self), "client_id": self._client_id}
         headers = {"Content-Type": "application/json"}
         data = json.dumps(p).encode("utf-8")
-        req = urllib3.PoolManager().request(
+        req = self._http.request(
             "POST",
             "http://{}/prompt".format(self._server_address),
             body=data,
@@ -83,7 +86,7 @@ class comfyServer(QWebSocket):
 
     def get_system_stats(self): 
         if self.is_connected():
-            req = urllib3.PoolManager().request(
+            req = self._http.request(
                 "GET", "http://{}/system_stats".format(self._server_address)
             )
             return json.loads(req.data)
@@ -93,7 +96,7 @@ class comfyServer(QWebSocket):
         p = {"prompt_id": prompt_id, "client_id": self._client_id}
         headers = {"Content-Type": "application/json"}
         data = json.dumps(p).encode("utf-8")
-        req = urllib3.PoolManager().request(
+        req = self._http.request(
             "POST",
             "http://{}/interrupt".format(self._server_address),
             body=data,
@@ -102,7 +105,7 @@ class comfyServer(QWebSocket):
         return req.data
 
     def get_history(self, prompt_id):
-        req = urllib3.PoolManager().request(
+        req = self._http.request(
             "GET", "http://{}/history/{}".format(self._server_address, prompt_id)
         )
         return json.loads(req.data)
@@ -154,13 +157,13 @@ class comfyServer(QWebSocket):
     def get_result(self, filename, subfolder, folder_type):
         data = {"filename": filename, "subfolder": subfolder, "type": folder_type}
         url_values = urlencode(data)
-        req = urllib3.PoolManager().request(
+        req = self._http.request(
             "GET", "http://{}/view?{}".format(self._server_address, url_values)
         )
         return req.data
 
     def get_object_info(self, node_class):
-        req = urllib3.PoolManager().request(
+        req = self._http.request(
             "GET", "http://{}/object_info/{}".format(self._server_address, node_class)
         )
         return json.loads(req.data)
@@ -180,7 +183,7 @@ class comfyServer(QWebSocket):
 
             headers = {"Content-Type": content_type}
 
-            req = urllib3.PoolManager().request(
+            req = self._http.request(
                 "POST",
                 "http://{}/upload/image".format(self._server_address),
                 body=data,
@@ -203,7 +206,7 @@ class comfyServer(QWebSocket):
 
             headers = {"Content-Type": content_type}
 
-            req = urllib3.PoolManager().request(
+            req = self._http.request(
                 "POST",
                 "http://{}/upload/image".format(self._server_address),
                 body=data,
@@ -214,7 +217,7 @@ class comfyServer(QWebSocket):
     def get_all_models_available(self):
         results = []
         try:
-            req = urllib3.PoolManager().request(
+            req = self._http.request(
                 "GET",
                 "http://{}/models".format(self._server_address),
             )
@@ -223,7 +226,7 @@ class comfyServer(QWebSocket):
             subdirs_to_check = subdirs
             for subdir in subdirs_to_check:
                 if subdir in subdirs:
-                    req = urllib3.PoolManager().request(
+                    req = self._http.request(
                         "GET",
                         "http://{}/models/{}".format(self._server_address, subdir),
                     )
@@ -237,7 +240,7 @@ class comfyServer(QWebSocket):
     def get_loras_available(self):
         results = []
         try:
-            req = urllib3.PoolManager().request(
+            req = self._http.request(
                 "GET",
                 "http://{}/models/loras".format(self._server_address),
             )
@@ -2,7 +2,6 @@
 Job class for managing workflow execution jobs.
 """
 import os
-import copy
 import time
 from random import randint
 
@@ -251,15 +250,21 @@ class Job:
         return result
 
     def get_workflow_for_submission(self, comfy_server):
-        workflow = copy.deepcopy(self.workflow)
+        # Only the top level of each node and its inputs are modified below,
+        # so copy just those dicts, dropping the GUI-only options entries,
+        # and share everything else with self.workflow
+        workflow = {}
+        for id, node in self.workflow.items():
+            node = dict(node)
+            node.pop("options", None)
+            if "inputs" in node:
+                node["inputs"] = dict(node["inputs"])
+            workflow[id] = node
         self.results[self.completions] = {}
         if self.completions == 0:
             self.results[0]["input_images"] = {}
             self.results[0]["input_videos"] = {}
         for id, node in workflow.items():
-            # remove any options entries
-            if "options" in node:
-                del node["options"]
             # replace any seed nodes that have -1 as a value
             if node["class_type"] == "SwarmInputInteger":
                 if (
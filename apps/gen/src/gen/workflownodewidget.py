@@ -5,11 +5,19 @@ This module contains the WorkflowNodeWidget class which represents
 a single GUI node in a workflow.
 """
 
+import math
 import os
 import cv2
 import numpy as np
 from core.utils import check_int, get_swarm_preview_path, is_video_file, numpy_to_qimage
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtGui import QImage, QPixmap, QTextOption
 from PySide6.QtWidgets import (
     QComboBox,
@@ -29,6 +37,88 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+def _safe_float(value):
+    """Convert value to a finite float, or return None if it is not a number."""
+    try:
+        result = float(value)
+    except (ValueError, TypeError):
+        return None
+    return result if math.isfinite(result) else None
+
+
+# Number of node thumbnails kept in memory across all node widgets
+THUMBNAIL_CACHE_SIZE = 64
+
+# Thumbnails by (absolute path, mtime), as (pixmap, width, height), oldest first
+_thumbnail_cache: dict[tuple[str, int], tuple[QPixmap, int, int]] = {}
+
+
+class ThumbnailLoaderSignals(QObject):
+    """Signals emitted by a ThumbnailLoader."""
+
+    # request id, thumbnail QImage, full width, full height
+    loaded = Signal(int, QImage, int, int)
+    # request id
+    failed = Signal(int)
+
+
+class ThumbnailLoader(QRunnable):
+    """
+    Load an image or the first frame of a video and scale it to a 128x128
+    thumbnail on a worker thread.
+    """
+
+    def __init__(self, file_path, request):
+        super().__init__()
+        self.file_path = file_path
+        self.request = request
+        self.signals = ThumbnailLoaderSignals()
+
+    def run(self):
+        file_path = self.file_path
+        image = None
+        try:
+            # Load the image
+            if is_video_file(file_path):
+                preview_path = get_swarm_preview_path(file_path)
+                if len(preview_path) > 0 and os.path.exists(preview_path):
+                    image = QImage(preview_path)
+                    if image.isNull():
+                        raise ValueError("Could not load image")
+                else:
+                    # Use cv2 to grab first frame from the video
+                    # Open the video file
+                    cap = cv2.VideoCapture(file_path)
+                    if cap.isOpened():
+                        # Read the first frame
+                        ret, frame = cap.read()
+                        cap.release()
+                        if ret and frame is not None:
+                            image = numpy_to_qimage(frame)
+            else:
+                image = QImage(file_path)
+                if image.isNull():
+                    raise ValueError("Could not load image")
+
+            if image is None:
+                return
+
+            # Scale to 128x128 while maintaining aspect ratio
+            thumbnail = image.scaled(
+                128,
+                128,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        except Exception as e:
+            print(f"Error loading thumbnail: {e}")
+            self.signals.failed.emit(self.request)
+            return
+
+        self.signals.loaded.emit(self.request, thumbnail, image.width(), image.height())
+
+
 class WorkflowNodeWidget(QWidget):
     """
     Widget representing a single GUI node.
@@ -42,16 +132,30 @@ class WorkflowNodeWidget(QWidget):
         self.node_data = node_data
         self.id = id
         self._type = None
+        self._value = None
+        # The input this node's value is written to when queueing, None for
+        # LoRA loaders which write lora_names and lora_weights
+        self.input_key = "value"
         self.input_width = 0
         self.input_height = 0
+        self._image_path_cache = {}
+        self._thumbnail_request = 0
+        self._thumbnail_key = None
 
         # have to have class_type
         if "class_type" not in node_data:
             return
 
         self.setAcceptDrops(False)
-
-        if self.node_data["class_type"] == "SwarmLoraLoader":
+        class_type = node_data["class_type"]
+        if class_type == "SwarmInputImage":
+            self.input_key = "image"
+        elif class_type == "SwarmInputVideo":
+            self.input_key = "video"
+        elif class_type == "SwarmLoraLoader":
+            self.input_key = None
+
+        if class_type == "SwarmLoraLoader":
             # Create a button that when pressed opens a lora selection dialog
             self._type = "lora"
             layout = QVBoxLayout()
@@ -69,7 +173,7 @@ class WorkflowNodeWidget(QWidget):
             # Create a button to open the lora selection dialog
             select_lora_button = QPushButton("Select LoRAs...")
             select_lora_button.setStyleSheet("font-size: 14px;")
-            select_lora_button.clicked.connect(lambda: self._open_lora_dialog())
+            select_lora_button.clicked.connect(self._open_lora_dialog)
             hlayout.addWidget(select_lora_button)
             
             # Add horizontal layout to main layout
@@ -87,13 +191,16 @@ class WorkflowNodeWidget(QWidget):
             return
 
         inputs = node_data["inputs"]
-        self._value = inputs["value"]
+        view_type = inputs.get("view_type")
+        title = str(inputs["title"])
+        current_val_raw = inputs.get("value")
+        self._value = current_val_raw
 
         # Traverse settings_list to build the widget
         # Create a label with the title value
-        title_label = QLabel(str(inputs["title"]))
+        title_label = QLabel(title)
         title_label.setStyleSheet("font-size: 14px;")
-        if "view_type" in inputs and inputs["view_type"] == "slider":
+        if view_type == "slider":
             self._type = "slider"
             layout = QVBoxLayout()
             layout.setContentsMargins(0, 0, 0, 0)
@@ -105,7 +212,7 @@ class WorkflowNodeWidget(QWidget):
             min_val = float(inputs["min"]) if "min" in inputs else 0
             max_val = float(inputs["view_max"]) if "view_max" in inputs else 100
             step = float(inputs["step"]) if "step" in inputs else 1
-            current_val = float(inputs["value"]) if "value" in inputs else min_val
+            current_val = float(current_val_raw) if "value" in inputs else min_val
 
             num_steps = round((max_val - min_val) / step)
             # Create the slider
@@ -117,22 +224,25 @@ class WorkflowNodeWidget(QWidget):
             slider.setPageStep(10)
 
             # Create a label to display the current value
-            value_label = QLabel(str(current_val))
-            value_label.setStyleSheet("font-size: 14px;")
-            self._set_slider_value(slider.value(), min_val, step, value_label)
+            self._min_val = min_val
+            self._max_val = max_val
+            self._step = step
+            self._inv_step = 1.0 / step
+            self._slider = slider
+            self._value_label = QLabel(str(current_val))
+            self._value_label.setStyleSheet("font-size: 14px;")
+            self._on_slider_changed(slider.value())
 
             # Connect slider value changes to update the label and self._value
-            slider.valueChanged.connect(
-                lambda idx: self._set_slider_value(idx, min_val, step, value_label)
-            )
+            slider.valueChanged.connect(self._on_slider_changed)
 
             # Add widgets to layout
-            hlayout.addWidget(value_label)
+            hlayout.addWidget(self._value_label)
             layout.addLayout(hlayout)
             layout.addWidget(slider)
             self.setLayout(layout)
 
-        if "view_type" in inputs and inputs["view_type"] == "seed":
+        if view_type == "seed":
             # Create a simple layout with node information
             self._type = "seed"
             layout = QHBoxLayout()
@@ -143,101 +253,92 @@ class WorkflowNodeWidget(QWidget):
             from PySide6.QtWidgets import QLineEdit
 
             # Get the current value
-            current_val = int(inputs["value"]) if "value" in inputs else 0
+            current_val = int(current_val_raw) if "value" in inputs else 0
 
             # Create a line edit for integer input
-            int_input = QLineEdit(str(current_val))
-            int_input.setFixedWidth(180)
-            int_input.setAlignment(Qt.AlignmentFlag.AlignRight)
-            int_input.setStyleSheet("font-size: 14px;")
+            self._int_input = QLineEdit(str(current_val))
+            self._int_input.setFixedWidth(180)
+            self._int_input.setAlignment(Qt.AlignmentFlag.AlignRight)
+            self._int_input.setStyleSheet("font-size: 14px;")
 
             # Connect text changes to update self._value
-            int_input.textChanged.connect(lambda text: self._set_int_value(text))
+            self._int_input.textChanged.connect(self._set_int_value)
 
             # Add widgets to layout
-            layout.addWidget(int_input)
+            layout.addWidget(self._int_input)
 
             # Add a reset button to the right of the int_input
             reset_button = QPushButton("↻")
             reset_button.setFixedSize(27, 27)
             reset_button.setStyleSheet("font-size: 21px; padding: 0;")
-            reset_button.clicked.connect(lambda: self._reset_seed_value(int_input))
+            reset_button.clicked.connect(self._on_reset_clicked)
             layout.addWidget(reset_button)
 
             self.setLayout(layout)
 
-        if node_data["class_type"] == "SwarmInputText":
+        if class_type == "SwarmInputText":
             # Add a multi-line text box under the title_label that grows as needed
-            self._type = inputs["view_type"]
+            self._type = view_type
             layout = QVBoxLayout()
             layout.setContentsMargins(0, 0, 0, 0)
             layout.addWidget(title_label)
 
             # Get the current value
-            current_val = inputs["value"] if "value" in inputs else ""
+            current_val = current_val_raw if "value" in inputs else ""
 
             # Create a text edit with word wrap
-            text_edit = QTextEdit(str(current_val))
-            text_edit.setStyleSheet("font-size: 14px;")
-            text_edit.setWordWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
-            text_edit.setSizePolicy(
+            self._text_edit = QTextEdit(str(current_val))
+            self._text_edit.setStyleSheet("font-size: 14px;")
+            self._text_edit.setWordWrapMode(
+                QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere
+            )
+            self._text_edit.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
             )
-            text_edit.setFixedHeight(109)  # Start with a fixed height, 5 lines
+            self._text_edit.setFixedHeight(109)  # Start with a fixed height, 5 lines
 
             # Connect text changes to update self._value
-            text_edit.textChanged.connect(
-                lambda widget=self: setattr(widget, "_value", text_edit.toPlainText())
-            )
+            self._text_edit.textChanged.connect(self._on_text_changed)
 
             # Add widget to layout
-            layout.addWidget(text_edit)
+            layout.addWidget(self._text_edit)
             self.setLayout(layout)
 
 
 
-        if node_data["class_type"] == "SwarmInputDropdown":
+        if class_type == "SwarmInputDropdown":
             # Create a dropdown menu selection
             self._type = "dropdown"
             layout = QHBoxLayout()
             layout.setContentsMargins(0, 0, 0, 0)
-
-            # Create a label with the title value
-            title_label = QLabel(str(inputs["title"]))
-            title_label.setStyleSheet("font-size: 14px;")
             layout.addWidget(title_label)
 
             # Create a combo box
-            combo_box = QComboBox()
-            combo_box.setStyleSheet("font-size: 14px;")
+            self._combo_box = QComboBox()
+            self._combo_box.setStyleSheet("font-size: 14px;")
 
             # Populate with options from node_data
             if "options" in node_data and node_data["options"]:
                 for option in node_data["options"]:
-                    combo_box.addItem(str(option))
+                    self._combo_box.addItem(str(option))
 
             # Set current value if it exists
             if "value" in inputs:
-                current_value = str(inputs["value"])
-                index = combo_box.findText(current_value)
+                current_value = str(current_val_raw)
+                index = self._combo_box.findText(current_value)
                 if index >= 0:
-                    combo_box.setCurrentIndex(index)
+                    self._combo_box.setCurrentIndex(index)
                 else:
                     self._value = node_data["options"][0]
 
             # Connect selection changes to update self._value
-            combo_box.currentTextChanged.connect(
-                lambda text, widget=self: setattr(widget, "_value", text)
-            )
+            self._combo_box.currentTextChanged.connect(self._on_combo_changed)
 
             # Add combo box to layout
-            layout.addWidget(combo_box)
+            layout.addWidget(self._combo_box)
             self.setLayout(layout)
 
-        if (
-            node_data["class_type"] == "SwarmInputImage"
-            or node_data["class_type"] == "SwarmInputVideo"
-        ):
+        if class_type == "SwarmInputImage" or class_type == "SwarmInputVideo":
             # Create a horizontal layout with title, button, filename on left and thumbnail on right
             layout = QHBoxLayout()
             layout.setContentsMargins(0, 0, 0, 0)
@@ -251,10 +352,6 @@ class WorkflowNodeWidget(QWidget):
             left_layout = QVBoxLayout()
             left_layout.setContentsMargins(0, 0, 0, 0)
             left_layout.setSpacing(5)
-
-            # Create a label with the title value
-            title_label = QLabel(str(inputs["title"]))
-            title_label.setStyleSheet("font-size: 14px;")
             left_layout.addWidget(title_label)
 
             # Create a "Choose File" button
@@ -291,14 +388,14 @@ class WorkflowNodeWidget(QWidget):
                 self._value = inputs["image"]
                 # Try to load and display the thumbnail
                 self._load_thumbnail(inputs["image"])
-                choose_file_button.clicked.connect(lambda: self._choose_image_file())
+                choose_file_button.clicked.connect(self._choose_image_file)
 
             if "video" in inputs and len(inputs["video"]):
                 self._type = "video"
                 self._value = inputs["video"]
                 # Try to load and display the thumbnail
                 self._load_thumbnail(inputs["video"])
-                choose_file_button.clicked.connect(lambda: self._choose_video_file())
+                choose_file_button.clicked.connect(self._choose_video_file)
 
             self.setLayout(layout)
 
@@ -309,20 +406,26 @@ class WorkflowNodeWidget(QWidget):
         if text is not None and len(text) > 0 and check_int(text):
             self._value = int(text)
 
-    def _reset_seed_value(self, line_edit):
+    def _on_reset_clicked(self):
         """Reset the seed value to -1."""
-        line_edit.setText("-1")
+        self._int_input.setText("-1")
         self._value = -1
 
-    def _set_slider_value(self, idx, min_val, step, label):
-        val = min_val + idx * step
+    def _on_slider_changed(self, idx):
+        val = self._min_val + idx * self._step
         if self.node_data["class_type"] == "SwarmInputInteger":
-            label.setText(str(int(val)))
+            self._value_label.setText(str(int(val)))
             self._value = val
         else:
-            label.setText(str(round(val, 8)))
+            self._value_label.setText(str(round(val, 8)))
             self._value = round(val, 8)
 
+    def _on_text_changed(self):
+        self._value = self._text_edit.toPlainText()
+
+    def _on_combo_changed(self, text):
+        self._value = text
+
     def _choose_video_file(self):
         """Open a file dialog to select an video file."""
         # Open file dialog to select an video file
@@ -360,65 +463,66 @@ class WorkflowNodeWidget(QWidget):
             self._load_thumbnail(file_path)
 
     def _load_thumbnail(self, file_path):
-        """Load and display a thumbnail of the image."""
-        if len(file_path) <= 0 or not os.path.exists(file_path):
-            return
+        """Start loading a thumbnail of the image in the background.
 
-        image = None
+        A newer request supersedes any load still in flight for this widget.
+        """
+        if len(file_path) <= 0:
+            return
         try:
-            # Load the image
-            if is_video_file(file_path):
-                preview_path = get_swarm_preview_path(file_path)
-                if len(preview_path) > 0 and os.path.exists(preview_path):
-                    image = QImage(preview_path)
-                    if image.isNull():
-                        raise ValueError("Could not load image")
-                else:
-                    # Use cv2 to grab first frame from the video
-                    # Open the video file
-                    cap = cv2.VideoCapture(file_path)
-                    if cap.isOpened():
-                        # Read the first frame
-                        ret, frame = cap.read()
-                        cap.release()
-                        if ret and frame is not None:
-                            image = numpy_to_qimage(frame)
-            else:
-                image = QImage(file_path)
-                if image.isNull():
-                    raise ValueError("Could not load image")
+            stat = os.stat(file_path)
+        except OSError:
+            return
 
-            if image is None:
-                return
+        self._thumbnail_request += 1
+        self._thumbnail_key = (os.path.abspath(file_path), stat.st_mtime_ns)
+        cached = _thumbnail_cache.get(self._thumbnail_key)
+        if cached is not None:
+            # Mark as most recently used
+            _thumbnail_cache[self._thumbnail_key] = _thumbnail_cache.pop(
+                self._thumbnail_key
+            )
+            self._show_thumbnail(*cached)
+            return
 
-            # Get image dimensions
-            self.input_width = image.width()
-            self.input_height = image.height()
+        loader = ThumbnailLoader(file_path, self._thumbnail_request)
+        loader.signals.loaded.connect(self._on_thumbnail_loaded)
+        loader.signals.failed.connect(self._on_thumbnail_failed)
+        QThreadPool.globalInstance().start(loader)
 
-            # Update dimensions label
-            if hasattr(self, "_dimensions_label"):
-                self._dimensions_label.setText(
-                    f"{self.input_width} × {self.input_height} px"
-                )
+    def _on_thumbnail_loaded(self, request, image, width, height):
+        """Display a thumbnail loaded by a ThumbnailLoader."""
+        if request != self._thumbnail_request:
+            return
 
-            # Scale to 128x128 while maintaining aspect ratio
-            pixmap = QPixmap.fromImage(image).scaled(
-                128,
-                128,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+        pixmap = QPixmap.fromImage(image)
+        if len(_thumbnail_cache) >= THUMBNAIL_CACHE_SIZE:
+            # Drop the least recently used thumbnail
+            del _thumbnail_cache[next(iter(_thumbnail_cache))]
+        _thumbnail_cache[self._thumbnail_key] = (pixmap, width, height)
+        self._show_thumbnail(pixmap, width, height)
 
-            # Display the thumbnail
-            self._thumbnail_label.setPixmap(pixmap)
+    def _show_thumbnail(self, pixmap, width, height):
+        """Display a thumbnail and the dimensions of the full image."""
+        # Get image dimensions
+        self.input_width = width
+        self.input_height = height
 
-        except Exception as e:
-            print(f"Error loading thumbnail: {e}")
-            # Show error message in the thumbnail area
-            self._thumbnail_label.setText("Invalid Image")
-            # Clear dimensions if error occurs
-            if hasattr(self, "_dimensions_label"):
-                self._dimensions_label.setText("")
+        # Update dimensions label
+        self._dimensions_label.setText(f"{self.input_width} × {self.input_height} px")
+
+        # Display the thumbnail
+        self._thumbnail_label.setPixmap(pixmap)
+
+    def _on_thumbnail_failed(self, request):
+        """Show an error when a ThumbnailLoader could not load the image."""
+        if request != self._thumbnail_request:
+            return
+
+        # Show error message in the thumbnail area
+        self._thumbnail_label.setText("Invalid Image")
+        # Clear dimensions if error occurs
+        self._dimensions_label.setText("")
 
     def get_value(self):
         if self._type is None:
@@ -477,139 +581,127 @@ class WorkflowNodeWidget(QWidget):
         """Set the value of a NodeWidget based on its type.
 
         Args:
-            node_widget: The NodeWidget to update
             value: The value to set
+            output_root: Root directory used to resolve relative image paths
         """
-        if not hasattr(self, "_type") or self._type is None:
+        if self._type is None:
             return
 
-        try:
-            if self._type == "slider":
-                # For sliders, we need to find the slider widget and set its value
-                # This is a bit hacky but works with the current implementation
-                layout = self.layout()
-                if layout:
-                    # Find the slider widget (it's the last widget in the layout)
-                    for i in range(layout.count()):
-                        item = layout.itemAt(i)
-                        if item and hasattr(item, "widget"):
-                            widget = item.widget()
-                            if isinstance(widget, QSlider):
-                                # Convert the value to the slider's range
-                                inputs = self.node_data.get("inputs", {})
-                                min_val = float(inputs.get("min", 0))
-                                step = float(inputs.get("step", 1))
-                                max_val = float(inputs.get("view_max", 100))
-
-                                # Try to convert the value to a number
-                                try:
-                                    numeric_value = float(value)
-                                    # Clamp the value to the slider range
-                                    numeric_value = max(
-                                        min_val, min(numeric_value, max_val)
-                                    )
-                                    # Calculate slider position
-                                    slider_pos = round((numeric_value - min_val) / step)
-                                    widget.setValue(slider_pos)
-                                    # Update the display label
-                                    for j in range(layout.count()):
-                                        label_item = layout.itemAt(j)
-                                        if label_item and hasattr(label_item, "widget"):
-                                            label_widget = label_item.widget()
-                                            if (
-                                                isinstance(label_widget, QLabel)
-                                                and j > 0
-                                            ):  # Skip title label
-                                                label_widget.setText(
-                                                    str(round(numeric_value, 8))
-                                                )
-                                                break
-                                except (ValueError, TypeError):
-                                    pass
-                                break
-
-            elif self._type == "seed":
-                # For seed inputs, find the QLineEdit widget
-                layout = self.layout()
-                if layout:
-                    for i in range(layout.count()):
-                        item = layout.itemAt(i)
-                        if item and hasattr(item, "widget"):
-                            widget = item.widget()
-                            if isinstance(widget, QLineEdit):
-                                widget.setText(str(value))
-                                break
-
-            elif self.node_data["class_type"] == "SwarmInputText":
-                # For text inputs (SwarmInputText), find the QTextEdit widget
-                layout = self.layout()
-                if layout:
-                    for i in range(layout.count()):
-                        item = layout.itemAt(i)
-                        if item and hasattr(item, "widget"):
-                            widget = item.widget()
-                            if isinstance(widget, QTextEdit):
-                                widget.setPlainText(str(value))
-                                break
-
-            elif self._type == "dropdown":
-                # For dropdown inputs, find the QComboBox widget
-                layout = self.layout()
-                if layout:
-                    for i in range(layout.count()):
-                        item = layout.itemAt(i)
-                        if item and hasattr(item, "widget"):
-                            widget = item.widget()
-                            if isinstance(widget, QComboBox):
-                                # Find the text in the dropdown
-                                index = widget.findText(str(value))
-                                if index >= 0:
-                                    widget.setCurrentIndex(index)
-                                break
-
-            elif self._type == "image" or self._type == "video":
-                image_path = str(value)
-
-                # If the image path is not a full path, try to find it
-                if not os.path.isabs(image_path):
-                    # 1) Check current directory
-                    if os.path.exists(image_path):
-                        image_path = os.path.abspath(image_path)
-                    # 2) Check output_root
-                    elif hasattr(self, "_output_root") and len(output_root) > 0:
-                        output_path = os.path.join(output_root, image_path)
-                        if os.path.exists(output_path):
-                            image_path = output_path
-                        elif len(image_path) >= 8:
-                            # 3) Check output_root/<year>-<mount>-<day> from first 8 characters of the filename
-                            dir_name = (
-                                f"{image_path[:4]}-{image_path[4:6]}-{image_path[6:8]}"
-                            )
-                            output_subdir_path = os.path.join(
-                                output_root, dir_name, image_path
-                            )
-                            if os.path.exists(output_subdir_path):
-                                image_path = output_subdir_path
-
-                    # If still not found leave blank
-                    if not os.path.exists(image_path):
-                        return
-
-                # For image inputs, update the file path and thumbnail
-                value = image_path
-                self._value = image_path
-                if hasattr(self, "_filename_label"):
-                    self._filename_label.setText(os.path.basename(image_path))
-                if hasattr(self, "_load_thumbnail") and os.path.exists(
-                    image_path
-                ):
-                    self._load_thumbnail(image_path)
+        setter = self._value_setters.get(self._type)
+        # Files are compared once their path has been resolved
+        if setter is not WorkflowNodeWidget._set_file_value and value == self._value:
+            # Invalid seed text doesn't update _value, so check what is shown
+            if (
+                setter is not WorkflowNodeWidget._set_seed_value
+                or self._int_input.text() == str(value)
+            ):
+                return
+        if setter is None and self.node_data["class_type"] == "SwarmInputText":
+            setter = WorkflowNodeWidget._set_text_value
 
-            # Update the internal value
+        if setter is None:
             self._value = value
+        else:
+            setter(self, value, output_root)
 
-        except Exception as e:
-            print(f"Error setting node widget value: {e}")
+    def _set_slider_value(self, value, output_root):
+        # Try to convert the value to a number in the slider's range
+        numeric_value = _safe_float(value)
+        if numeric_value is None:
+            print(f"Error setting slider value: {value!r} is not a number")
+        else:
+            # Clamp the value to the slider range
+            numeric_value = max(self._min_val, min(numeric_value, self._max_val))
+            # Calculate slider position
+            slider_pos = round((numeric_value - self._min_val) * self._inv_step)
+            with QSignalBlocker(self._slider):
+                self._slider.setValue(slider_pos)
+            # valueChanged was blocked, so format the label for the snapped
+            # position here
+            self._on_slider_changed(slider_pos)
+        self._value = value
+
+    def _set_seed_value(self, value, output_root):
+        with QSignalBlocker(self._int_input):
+            self._int_input.setText(str(value))
+        self._value = value
+
+    def _set_text_value(self, value, output_root):
+        with QSignalBlocker(self._text_edit):
+            self._text_edit.setPlainText(str(value))
+        self._value = value
+
+    def _set_dropdown_value(self, value, output_root):
+        # Find the text in the dropdown
+        index = self._combo_box.findText(str(value))
+        if index >= 0:
+            with QSignalBlocker(self._combo_box):
+                self._combo_box.setCurrentIndex(index)
+        self._value = value
+
+    def _set_file_value(self, value, output_root):
+        image_path = str(value)
+
+        # If the image path is not a full path, try to find it
+        if not os.path.isabs(image_path):
+            image_path = self._resolve_image_path(image_path, output_root)
+            # If still not found leave blank
+            if image_path is None:
+                return
+
+        if image_path == self._value:
+            return
+
+        # For image inputs, update the file path and thumbnail
+        self._value = image_path
+        self._filename_label.setText(os.path.basename(image_path))
+        self._load_thumbnail(image_path)
+
+    def _resolve_image_path(self, image_path, output_root):
+        """Find a relative image path on disk.
+
+        Checks the current directory, then output_root, then
+        output_root/<year>-<month>-<day> from the first 8 characters of the
+        filename. Found paths are remembered for later lookups.
+
+        Args:
+            image_path: The relative path to resolve
+            output_root: The output root directory, may be empty
+
+        Returns:
+            The resolved path, or None if the file was not found
+        """
+        key = (image_path, output_root)
+        resolved = self._image_path_cache.get(key)
+        if resolved is not None:
+            return resolved
+
+        candidates = [image_path]
+        if len(output_root) > 0:
+            candidates.append(os.path.join(output_root, image_path))
+            if len(image_path) >= 8:
+                dir_name = f"{image_path[:4]}-{image_path[4:6]}-{image_path[6:8]}"
+                candidates.append(os.path.join(output_root, dir_name, image_path))
+
+        for candidate in candidates:
+            try:
+                os.stat(candidate)
+            except OSError:
+                continue
+            resolved = os.path.abspath(candidate)
+            self._image_path_cache[key] = resolved
+            return resolved
+
+        return None
+
+    # Value setters by widget type, text widgets are matched by class_type
+    _value_setters = {
+        "slider": _set_slider_value,
+        "seed": _set_seed_value,
+        "dropdown": _set_dropdown_value,
+        "image": _set_file_value,
+        "video": _set_file_value,
+    }
 
     def _open_lora_dialog(self):
         """Open the Lora selection dialog."""
@@ -3,14 +3,24 @@ Jobs widget for the Dueser application.
 Contains a QTabWidget with Workflows and Settings tabs.
 """
 
-import copy
 import json
+import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from core.metadatahandler import MetadataHandler
-from PySide6.QtCore import Qt, Signal
+from core.utils import check_int
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -33,19 +43,130 @@ from PySide6.QtWidgets import (
 from .comfyserver import comfyServer
 from .workflownodewidget import WorkflowNodeWidget
 
-class WorkflowsTreeWidgetItem(QTreeWidgetItem):
+# Use orjson for parsing workflows when it is installed, both take bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+# Item data roles used by the workflows tree for the file or directory path
+# of an item, and whether a directory item has been populated yet
+FULL_PATH_ROLE = Qt.ItemDataRole.UserRole
+IS_POPULATED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _order_priority(item):
+    """Sort key for (id, node) pairs using the node's order_priority field."""
+    return item[1].get("order_priority", 0)
+
+
+# Maximum number of subdirectories checked for JSON files at the same time
+SCAN_WORKERS = 8
+
+
+def _build_consumer_index(workflow_data):
+    """Build a reverse index of the links in a workflow.
+
+    Args:
+        workflow_data: Dictionary of workflow nodes keyed by id
+
+    Returns:
+        Dictionary mapping producer id -> [(consumer node, input name)]
     """
-    Custom QTreeWidgetItem subclass for workflows that adds full_path and is_populated members.
+    consumers_by_producer = {}
+    for consumer in workflow_data.values():
+        for name, input in consumer.get("inputs", {}).items():
+            if isinstance(input, list) and input:
+                consumers_by_producer.setdefault(input[0], []).append(
+                    (consumer, name)
+                )
+    return consumers_by_producer
+
+
+def _dir_contains_json(path):
+    """Check whether a directory or any directory below it holds a JSON file.
 
-    This item extends QTreeWidgetItem to include additional attributes for managing
-    workflow file paths and lazy loading state.
+    The scan stops at the first JSON file found, so only as much of the tree
+    is read as needed to answer.
+
+    Args:
+        path: The directory to check
+
+    Returns:
+        True if a JSON file was found
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name[-5:] == ".json" and entry.is_file():
+                        return True
+        except OSError:
+            continue
+    return False
+
+
+def _scan_workflow_dir(path):
+    """List one level of a workflows directory.
+
+    Args:
+        path: The directory to list
+
+    Returns:
+        Tuple of (subdirs, json_filenames) where subdirs holds the paths of
+        the subdirectories that contain JSON files somewhere below them
     """
+    candidates = []
+    json_filenames = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                candidates.append(entry.path)
+            elif entry.name[-5:] == ".json" and entry.is_file():
+                json_filenames.append(entry.name)
+
+    # Checking a subdirectory may mean reading a whole branch, and remote
+    # filesystems serve parallel reads much better than sequential ones
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(SCAN_WORKERS, len(candidates))
+        ) as executor:
+            has_json = list(executor.map(_dir_contains_json, candidates))
+    else:
+        has_json = [_dir_contains_json(c) for c in candidates]
+    subdirs = [c for c, found in zip(candidates, has_json) if found]
+    return subdirs, json_filenames
+
+
+class WorkflowDirScannerSignals(QObject):
+    """Signals emitted by a WorkflowDirScanner."""
+
+    # directory path, subdirectory paths, JSON filenames
+    scanned = Signal(str, list, list)
+    # directory path, error message
+    failed = Signal(str, str)
+
+
+class WorkflowDirScanner(QRunnable):
+    """List one level of a workflows directory on a worker thread."""
+
+    def __init__(self, dir_path):
+        super().__init__()
+        self.dir_path = dir_path
+        self.signals = WorkflowDirScannerSignals()
 
-    def __init__(self, parent: QTreeWidget, strings: list[str]):
-        super().__init__(parent, strings)
-        # Initialize custom attributes
-        self.full_path: Optional[str] = None
-        self.is_populated: bool = False
+    def run(self):
+        try:
+            subdirs, json_filenames = _scan_workflow_dir(self.dir_path)
+        except OSError as e:
+            self.signals.failed.emit(self.dir_path, str(e))
+            return
+        self.signals.scanned.emit(self.dir_path, subdirs, json_filenames)
 
 
 class WorkflowsWidget(QWidget):
@@ -54,19 +175,41 @@ class WorkflowsWidget(QWidget):
     """
 
     _comfy_server: comfyServer
-    _workflow_data: dict
-    _settings_widget: QWidget
+    _workflow_data: Optional[dict]
+    _settings_widget: Optional[QWidget]
 
     # Signal emitted when a job is queued
     job_queued = Signal(str, dict, int)
 
 
     PRESETS_FILENAME = "presets.json"
+    FLAT_METADATA_CACHE_SIZE = 32
+    NODE_WIDGET_BATCH_SIZE = 5
 
     def __init__(self):
         super().__init__()
         self.setMinimumWidth(250)
 
+        # Workflow and settings state, filled in as workflows are loaded
+        self.workflows_directory = "workflows"
+        self._output_root = ""
+        self._workflow_data = None
+        self._workflow_data_filename: Optional[str] = None
+        self._settings_widget = None
+        self._node_widgets = []
+        self._node_widgets_by_id = {}
+        self._node_widgets_by_title = {}
+
+        # Directory items in the workflows tree keyed by full path, and
+        # workflow file items keyed by filename without the extension
+        self._path_to_item: dict[str, QTreeWidgetItem] = {}
+        self._name_to_item: dict[str, QTreeWidgetItem] = {}
+
+        # Directories being scanned on a worker thread, and the placeholder
+        # shown until the top level has been scanned
+        self._pending_scans: set[str] = set()
+        self._loading_item: Optional[QTreeWidgetItem] = None
+
         # Create main layout
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -85,6 +228,18 @@ class WorkflowsWidget(QWidget):
         # Add tabs
         self.tab_widget.addTab(self.workflows_tab, "Workflows")
         self.tab_widget.addTab(self.settings_tab, "Settings")
+        self._pending_gui_nodes = None
+        self._node_widget_batch_scheduled = False
+        self._queue_count_value = 1
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+
+        # Cache of object_info responses from the comfy server by class_type
+        self._object_info_cache: dict[str, dict] = {}
+
+        # Cache of flattened metadata keyed by (path, mtime, size), and the
+        # handler used to read it
+        self._flat_metadata_cache: dict[tuple, dict] = {}
+        self._metadata_handler = MetadataHandler()
 
         # Load presets and create Presets tab
         self._presets: dict = {}
@@ -105,6 +260,26 @@ class WorkflowsWidget(QWidget):
 
     def set_comfy_server(self, comfy_server):
         self._comfy_server = comfy_server
+        self.invalidate_object_info()
+
+    def invalidate_object_info(self):
+        """Clear the cached object_info responses from the comfy server."""
+        self._object_info_cache.clear()
+
+    def _get_object_info(self, class_type):
+        """Return the object_info for a class_type, querying the server only once.
+
+        Args:
+            class_type: The node class to look up
+
+        Returns:
+            The object_info response for that class
+        """
+        info = self._object_info_cache.get(class_type)
+        if info is None:
+            info = self._comfy_server.get_object_info(class_type)
+            self._object_info_cache[class_type] = info
+        return info
 
     def set_output_root(self, root):
         """Set the output root directory for finding image files.
@@ -128,8 +303,12 @@ class WorkflowsWidget(QWidget):
         self.workflows_tree.setFont(font)
 
         # Connect signals
-        self.workflows_tree.itemClicked.connect(self._on_workflow_item_clicked)
-        self.workflows_tree.itemExpanded.connect(self._on_item_expanded)
+        self.workflows_tree.itemClicked.connect(
+            self._on_workflow_item_clicked, Qt.ConnectionType.UniqueConnection
+        )
+        self.workflows_tree.itemExpanded.connect(
+            self._on_item_expanded, Qt.ConnectionType.UniqueConnection
+        )
 
         # Populate tree with workflows directory
         self._populate_workflows_tree()
@@ -140,16 +319,16 @@ class WorkflowsWidget(QWidget):
     def _populate_workflows_tree(self):
         """Populate the tree widget with workflows directory structure."""
         # Use the workflows directory from instance variable or default to "workflows"
-        workflows_dir = getattr(self, "workflows_directory", "workflows")
+        workflows_dir = self.workflows_directory
+        self._path_to_item = {}
+        self._name_to_item = {}
+        self._pending_scans = set()
+        self._loading_item = None
 
         if not os.path.exists(workflows_dir):
             # Create workflows directory if it doesn't exist
             os.makedirs(workflows_dir)
-            root_name = (
-                os.path.basename(workflows_dir)
-                if os.path.basename(workflows_dir)
-                else "workflows"
-            )
+            root_name = os.path.basename(workflows_dir) or "workflows"
             # Show message directly in tree
             root = QTreeWidgetItem(self.workflows_tree, [f"{root_name} (empty)"])
             root.setChildIndicatorPolicy(
@@ -157,168 +336,141 @@ class WorkflowsWidget(QWidget):
             )
             return
 
-        # First pass: find all directories that contain JSON files
-        json_dirs = set()
-
-        for dirpath, dirnames, filenames in os.walk(workflows_dir, topdown=False):
-            # Check if this directory contains any JSON files
-            has_json = any(filename.endswith(".json") for filename in filenames)
-            if has_json:
-                json_dirs.add(dirpath)
-
-        if not json_dirs:
-            # No JSON files found
-            root_name = (
-                os.path.basename(workflows_dir)
-                if os.path.basename(workflows_dir)
-                else "workflows"
-            )
-            # Show message directly in tree
-            root = WorkflowsTreeWidgetItem(
-                self.workflows_tree, [f"{root_name} (no JSON files)"]
-            )
-            root.setChildIndicatorPolicy(
-                QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicator
-            )
+        # Only the top level is scanned here, deeper levels are filled in
+        # as their items are expanded (lazy loading). Scanning happens on a
+        # worker thread so slow or remote filesystems don't block the GUI.
+        self._loading_item = QTreeWidgetItem(self.workflows_tree, ["Loading..."])
+        self._loading_item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicator
+        )
+        self._start_directory_scan(workflows_dir)
+
+    def _start_directory_scan(self, dir_path):
+        """Scan a directory on a worker thread and add its entries when done.
+
+        Args:
+            dir_path: The directory to scan
+        """
+        self._pending_scans.add(dir_path)
+        scanner = WorkflowDirScanner(dir_path)
+        scanner.signals.scanned.connect(self._on_directory_scanned)
+        scanner.signals.failed.connect(self._on_directory_scan_failed)
+        QThreadPool.globalInstance().start(scanner)
+
+    def _on_directory_scanned(self, dir_path, subdirs, json_filenames):
+        """Add the entries found by a background directory scan."""
+        # Ignore scans that were superseded or already done synchronously
+        if dir_path not in self._pending_scans:
             return
+        self._pending_scans.discard(dir_path)
+        self._add_workflow_entries(dir_path, subdirs, json_filenames)
 
-        # Build the tree structure with only directories containing JSON files
-        # but don't add the JSON files yet (lazy loading)
-        # Start directly with subdirectories of workflows_dir
-        for dirpath, dirnames, filenames in os.walk(workflows_dir):
-            # Get relative path
-            rel_path = os.path.relpath(dirpath, workflows_dir)
+    def _on_directory_scan_failed(self, dir_path, error):
+        """Report a background directory scan that failed."""
+        if dir_path not in self._pending_scans:
+            return
+        self._pending_scans.discard(dir_path)
+        logger.error("Error populating directory %s: %s", dir_path, error)
+        self._add_workflow_entries(dir_path, [], [])
 
-            # Only process directories that contain JSON files
-            if dirpath not in json_dirs:
-                continue
+    def _populate_directory(self, dir_path):
+        """Scan a directory and add its entries without waiting for a worker.
 
-            # Determine parent item
-            if rel_path == ".":
-                # This is the workflows_dir itself
-                # Add JSON files directly to the tree
-                for filename in filenames:
-                    if filename.endswith(".json"):
-                        file_item = WorkflowsTreeWidgetItem(
-                            self.workflows_tree, [filename]
-                        )
-                        file_item.setChildIndicatorPolicy(
-                            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
-                        )
-                        # Store full path for loading
-                        file_item.full_path = os.path.join(workflows_dir, filename)
-                continue
+        Args:
+            dir_path: The directory to populate
+        """
+        self._pending_scans.discard(dir_path)
+        try:
+            subdirs, json_filenames = _scan_workflow_dir(dir_path)
+        except OSError as e:
+            logger.error("Error populating directory %s: %s", dir_path, e)
+            subdirs, json_filenames = [], []
+        self._add_workflow_entries(dir_path, subdirs, json_filenames)
 
-            # Find or create parent item
-            parent_path_parts = rel_path.split(os.sep)
-            # The parent should be the item above the current directory
-            parent_path = os.path.join(workflows_dir, *parent_path_parts[:-1])
+    def _add_workflow_entries(self, dir_path, subdirs, json_filenames):
+        """Add directory and JSON file items for one level of the tree.
 
-            if parent_path == workflows_dir:
-                # Parent is the root workflows directory, add directly to tree
-                parent_item = None
-            else:
-                # Find parent in tree
-                parent_item = self._find_item_in_tree(
-                    self.workflows_tree.invisibleRootItem(), parent_path
-                )
+        Directory items are added unpopulated and filled in when expanded.
 
-            # Add current directory
-            dirname = os.path.basename(dirpath)
-            if parent_item is None:
-                # Add as top-level item
-                dir_item = WorkflowsTreeWidgetItem(self.workflows_tree, [dirname])
-            else:
-                dir_item = WorkflowsTreeWidgetItem(parent_item, [dirname])
+        Args:
+            dir_path: The directory the entries were listed from
+            subdirs: Paths of the subdirectories to add
+            json_filenames: Names of the JSON files to add
+        """
+        if dir_path == self.workflows_directory:
+            parent = self.workflows_tree
+            if self._loading_item is not None:
+                self.workflows_tree.takeTopLevelItem(
+                    self.workflows_tree.indexOfTopLevelItem(self._loading_item)
+                )
+                self._loading_item = None
+
+            if not subdirs and not json_filenames:
+                # No JSON files found
+                root_name = os.path.basename(dir_path) or "workflows"
+                # Show message directly in tree
+                root = QTreeWidgetItem(
+                    self.workflows_tree, [f"{root_name} (no JSON files)"]
+                )
+                root.setChildIndicatorPolicy(
+                    QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicator
+                )
+                return
+        else:
+            parent = self._path_to_item.get(dir_path)
+            if parent is None:
+                return
 
+        # Build the items unparented so the whole level is inserted at once
+        items = []
+        for subdir in subdirs:
+            dir_item = QTreeWidgetItem([os.path.basename(subdir)])
             dir_item.setChildIndicatorPolicy(
                 QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
             )
             # Store path for lazy loading
-            dir_item.full_path = dirpath
-            dir_item.is_populated = False
-
-        # No need to expand root since we don't have a root item
-
-    def _find_item_in_tree(self, parent, target_path):
-        """Find an item in the tree by its full path."""
-        # Check if this parent is the target
-        if hasattr(parent, "full_path") and parent.full_path == target_path:
-            return parent
-
-        # Search recursively in children
-        for i in range(parent.childCount()):
-            child = parent.child(i)
-            if hasattr(child, "full_path") and child.full_path == target_path:
-                return child
-            # Recursively search in child's children
-            found = self._find_item_in_tree(child, target_path)
-            if found:
-                return found
-
-        return None
+            dir_item.setData(0, FULL_PATH_ROLE, subdir)
+            dir_item.setData(0, IS_POPULATED_ROLE, False)
+            self._path_to_item[subdir] = dir_item
+            items.append(dir_item)
+
+        for filename in json_filenames:
+            file_item = QTreeWidgetItem([filename])
+            file_item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+            )
+            # Store full path for loading
+            file_item.setData(0, FULL_PATH_ROLE, os.path.join(dir_path, filename))
+            self._name_to_item.setdefault(filename[:-5], file_item)
+            items.append(file_item)
 
-    def _find_or_create_item(self, parent, path_parts):
-        """Find or create a tree item for the given path parts."""
-        if not path_parts:
-            return parent
-
-        # Find child with matching name
-        for i in range(parent.childCount()):
-            child = parent.child(i)
-            if child.text(0) == path_parts[0]:
-                return self._find_or_create_item(child, path_parts[1:])
-
-        # Create new item
-        new_item = QTreeWidgetItem(parent, [path_parts[0]])
-        new_item.setChildIndicatorPolicy(
-            QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
-        )
-        return self._find_or_create_item(new_item, path_parts[1:])
+        # Add the whole level without repainting or signalling per item
+        self.workflows_tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.workflows_tree):
+                if parent is self.workflows_tree:
+                    self.workflows_tree.addTopLevelItems(items)
+                else:
+                    parent.addChildren(items)
+        finally:
+            self.workflows_tree.setUpdatesEnabled(True)
 
     def _on_item_expanded(self, item):
         """Handle item expansion in the workflows tree (lazy loading)."""
         # Only populate if this item hasn't been populated yet and it's a directory
-        if not getattr(item, "is_populated", True):
-            self._populate_directory(item)
-
-    def _populate_directory(self, item):
-        """Populate a directory item with its JSON files."""
-        # Mark as populated to avoid re-populating
-        item.is_populated = True
-
-        # Get the full path of this directory
-        dir_path = getattr(item, "full_path", None)
-
-        if dir_path is None:
-            # This is the root item
-            workflows_dir = getattr(self, "workflows_directory", "workflows")
-            dir_path = workflows_dir
-
-        # List all JSON files in this directory
-        try:
-            filenames = os.listdir(dir_path)
-            json_files = [f for f in filenames if f.endswith(".json")]
-
-            # Add JSON files as children
-            for filename in json_files:
-                file_item = WorkflowsTreeWidgetItem(item, [filename])
-                file_item.setChildIndicatorPolicy(
-                    QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
-                )
-                # Store full path for loading
-                file_item.full_path = os.path.join(dir_path, filename)
-
-        except Exception as e:
-            print(f"Error populating directory {dir_path}: {e}")
+        if item.data(0, IS_POPULATED_ROLE) is False:
+            # Mark as populated to avoid re-populating
+            item.setData(0, IS_POPULATED_ROLE, True)
+            self._start_directory_scan(item.data(0, FULL_PATH_ROLE))
 
     def _on_workflow_item_clicked(self, item):
         """Handle item click in the workflows tree."""
         # Check if the clicked item is a JSON file
-        if item.childCount() == 0 and item.text(0).endswith(".json"):
+        stem, sep, ext = item.text(0).rpartition(".")
+        if sep and ext == "json" and item.childCount() == 0:
             self._workflow_data = self.load_workflow(item)
             # Store the filename without extension for the title
-            self._workflow_data_filename = os.path.splitext(item.text(0))[0]
+            self._workflow_data_filename = stem
             self._gui_nodes = self.extract_gui_nodes(self._workflow_data)
             self.build_gui_from_nodes(self._gui_nodes)
             # Switch to the Settings tab
@@ -332,11 +484,11 @@ class WorkflowsWidget(QWidget):
             tree_item: The QTreeWidgetItem representing the JSON file
         """
         # Get the full path to the JSON file
-        file_path = getattr(tree_item, "full_path", None)
+        file_path = tree_item.data(0, FULL_PATH_ROLE)
 
         if file_path is None:
-            # Fallback to old method if full_path is not set
-            workflows_dir = getattr(self, "workflows_directory", "workflows")
+            # Fallback to old method if the full path is not set
+            workflows_dir = self.workflows_directory
 
             # Build the path by traversing up the tree
             path_parts = []
@@ -346,11 +498,7 @@ class WorkflowsWidget(QWidget):
                 current = current.parent()
 
             # The parent should be the root workflows item
-            root_name = (
-                os.path.basename(workflows_dir)
-                if os.path.basename(workflows_dir)
-                else "workflows"
-            )
+            root_name = os.path.basename(workflows_dir) or "workflows"
             if current.text(0) != root_name:
                 return {}
 
@@ -358,12 +506,11 @@ class WorkflowsWidget(QWidget):
 
         # Load and parse the JSON file
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                workflow = json.load(f)
-                return workflow
+            with open(file_path, "rb") as f:
+                return json_loads(f.read())
 
         except Exception as e:
-            print(f"Error loading workflow {file_path}: {e}")
+            logger.error("Error loading workflow %s: %s", file_path, e)
 
         return {}
 
@@ -371,22 +518,18 @@ class WorkflowsWidget(QWidget):
         """
         Search for a workflow by name in the workflows tree and load it.
 
-        This method searches through all JSON files in the workflows tree
-        to find one whose filename (without extension) matches the given
-        workflow_name. If found, it loads that workflow and builds the GUI.
+        This method looks up the JSON file whose filename (without extension)
+        matches the given workflow_name, searching directories that have not
+        been expanded yet if needed. If found, it loads that workflow and
+        builds the GUI.
 
         Args:
             workflow_name (str): The name of the workflow to load (without .json extension)
         """
-        if not hasattr(self, "workflows_tree"):
-            print(
-                f"Warning: workflows_tree not initialized, cannot load workflow by name: {workflow_name}"
-            )
-            return
-
-        # Search through all items in the tree
-        root = self.workflows_tree.invisibleRootItem()
-        found_item = self._find_workflow_by_name(root, workflow_name)
+        found_item = self._name_to_item.get(workflow_name)
+        if found_item is None:
+            # The workflow may be in a directory that hasn't been expanded yet
+            found_item = self._find_unloaded_workflow(workflow_name)
 
         if found_item:
             # Load the workflow
@@ -399,31 +542,54 @@ class WorkflowsWidget(QWidget):
             # Switch to the Settings tab
             self.tab_widget.setCurrentWidget(self.settings_tab)
         else:
-            print(f"Warning: Workflow '{workflow_name}' not found in workflows tree")
+            logger.warning("Workflow '%s' not found in workflows tree", workflow_name)
 
-    def _find_workflow_by_name(self, parent_item, workflow_name):
+    def _find_unloaded_workflow(self, workflow_name):
         """
-        Recursively search for a workflow file with the given name.
+        Search the workflows directory on disk for a workflow file and
+        populate the tree down to it.
 
         Args:
-            parent_item: The parent QTreeWidgetItem to search under
             workflow_name (str): The name of the workflow to find (without .json extension)
 
         Returns:
             QTreeWidgetItem: The found workflow item, or None if not found
         """
-        # Check if this item is a JSON file with matching name
-        if parent_item.childCount() == 0 and parent_item.text(0).endswith(".json"):
-            item_name = os.path.splitext(parent_item.text(0))[0]
-            if item_name == workflow_name:
-                return parent_item
-
-        # Recursively search in children
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            found = self._find_workflow_by_name(child, workflow_name)
-            if found:
-                return found
+        target = workflow_name + ".json"
+        stack = [self.workflows_directory]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name == target and entry.is_file():
+                            break
+                    else:
+                        continue
+            except OSError:
+                continue
+
+            # Populate each directory between the root and the file, including
+            # any still waiting on a background scan
+            current = self.workflows_directory
+            if current in self._pending_scans:
+                self._populate_directory(current)
+            rel_path = os.path.relpath(dir_path, self.workflows_directory)
+            if rel_path != ".":
+                for part in rel_path.split(os.sep):
+                    current = os.path.join(current, part)
+                    item = self._path_to_item.get(current)
+                    if item is None:
+                        return None
+                    if (
+                        not item.data(0, IS_POPULATED_ROLE)
+                        or current in self._pending_scans
+                    ):
+                        item.setData(0, IS_POPULATED_ROLE, True)
+                        self._populate_directory(current)
+            return self._name_to_item.get(workflow_name)
 
         return None
 
@@ -434,7 +600,7 @@ class WorkflowsWidget(QWidget):
 
     def set_settings_content(self, widget):
         """Replace the settings tab content."""
-        if hasattr(self, "_settings_widget"):
+        if self._settings_widget is not None:
             self._settings_layout.removeWidget(self._settings_widget)
             self._settings_widget.deleteLater()
         self._settings_widget = widget
@@ -451,49 +617,64 @@ class WorkflowsWidget(QWidget):
             workflow_data: Dictionary containing workflow data with nodes
 
         Returns:
-            List of nodes whose type starts with 'SwarmInput'
+            List of (id, node) pairs whose type starts with 'SwarmInput',
+            sorted by their order_priority field if it exists
         """
-        gui_nodes = {}
+        gui_nodes = []
+        has_order_priority = False
+
+        # Reverse index of links, built when the first dropdown needs it
+        consumers_by_producer = None
 
         # Iterate through all nodes
         for id, node in workflow_data.items():
-            # Check if node has a type attribute and if it starts with 'SwarmInput'
-            if (
-                "class_type" in node
-                and node["class_type"].startswith("SwarmInput")
-                and not node["class_type"].startswith("SwarmInputGroup")
-            ):
-                gui_nodes[id] = node
-                # find the options for a swarm dropdown
-                if node["class_type"] == "SwarmInputDropdown":
-                    for id2, node2 in workflow_data.items():
-                        for name, input in node2["inputs"].items():
-                            if isinstance(input, list) and input[0] == id:
-                                # call the server to get the info for that class
-                                info = self._comfy_server.get_object_info(
-                                    node2["class_type"]
-                                )
-                                classinfo = info[node2["class_type"]]
-                                # extract and store the options
-                                options = None
-                                if "required" in classinfo["input"]:
-                                    options = classinfo["input"]["required"][name]
-                                elif "optional" in classinfo["input"]:
-                                    options = classinfo["input"]["optional"][name]
-                                if options is not None:
-                                    if options[0] == "COMBO":
-                                        options = options[1]["options"]
-                                    else:
-                                        options = options[0]
-                                node["options"] = options
-
-            # find the options for a swarm lora loader
-            elif node["class_type"] == "SwarmLoraLoader":
-                loras = self._comfy_server.get_loras_available()
-                node["options"] = loras
-                gui_nodes[id] = node
-                # print(loras)
+            class_type = node.get("class_type", "")
+            # Only nodes whose type starts with 'SwarmInput', other than
+            # groups, and lora loaders are shown in the GUI
+            if class_type.startswith("SwarmInput"):
+                if class_type.startswith("SwarmInputGroup"):
+                    continue
+            elif class_type != "SwarmLoraLoader":
+                continue
+
+            gui_nodes.append((id, node))
+            if "order_priority" in node:
+                has_order_priority = True
 
+            match class_type:
+                # find the options for a swarm dropdown
+                case "SwarmInputDropdown":
+                    if consumers_by_producer is None:
+                        consumers_by_producer = _build_consumer_index(workflow_data)
+                    for node2, name in consumers_by_producer.get(id, []):
+                        # get the info for that class (cached per server)
+                        consumer_type = node2["class_type"]
+                        info = self._get_object_info(consumer_type)
+                        class_input = info[consumer_type]["input"]
+                        # extract and store the options
+                        options = class_input.get("required", {}).get(name)
+                        if options is None:
+                            options = class_input.get("optional", {}).get(name)
+                        if options is not None:
+                            if options[0] == "COMBO":
+                                options = options[1]["options"]
+                            else:
+                                options = options[0]
+                        node["options"] = options
+                        # the first consumer that declares the input is enough
+                        if options is not None:
+                            break
+
+                # find the options for a swarm lora loader
+                case "SwarmLoraLoader":
+                    loras = self._comfy_server.get_loras_available()
+                    node["options"] = loras
+                    logger.debug("Available loras: %s", loras)
+
+        # The sort is stable, so without any priorities it would not change
+        # the workflow order
+        if has_order_priority:
+            gui_nodes.sort(key=_order_priority)
         return gui_nodes
 
     def build_gui_from_nodes(self, gui_nodes):
@@ -503,7 +684,7 @@ class WorkflowsWidget(QWidget):
         Creates a vertical layout filled with one widget per GUI node.
 
         Args:
-            gui_nodes: List of GUI nodes to display
+            gui_nodes: List of (id, node) pairs to display, already in display order
         """
         # Create a container widget for the settings content
         container = QWidget()
@@ -520,7 +701,7 @@ class WorkflowsWidget(QWidget):
 
         # Get the workflow filename from the stored attribute
         workflow_filename = "GUI Configuration"
-        if hasattr(self, "_workflow_data_filename"):
+        if self._workflow_data_filename is not None:
             workflow_filename = self._workflow_data_filename
 
         title = QLabel(workflow_filename)
@@ -533,18 +714,15 @@ class WorkflowsWidget(QWidget):
         hlayout.setContentsMargins(0, 0, 0, 0)
 
         # Create a line edit for queue count
-        self._queue_count = QLineEdit("1")
+        self._queue_count = QLineEdit(str(self._queue_count_value))
         self._queue_count.setFixedWidth(50)
         self._queue_count.setStyleSheet("font-size: 14px;")
+        self._queue_count.editingFinished.connect(self._on_queue_count_edited)
 
         # Create a Queue button
         queue_button = QPushButton("Queue")
         queue_button.setStyleSheet("font-size: 14px;")
-
-        # Make the button clickable
-        queue_button.mousePressEvent = lambda event: self._queue_job(
-            int(self._queue_count.text())
-        )
+        queue_button.clicked.connect(self._on_queue_clicked)
 
         # Create a Save Preset button
         save_button = QPushButton("Save")
@@ -560,20 +738,13 @@ class WorkflowsWidget(QWidget):
         layout.addLayout(hlayout)
 
         #
-        # Create a widget for each GUI node
+        # The widget for each GUI node is created when the Settings tab is
+        # first shown or when the widgets are first needed
         self._node_widgets = []
-        # Sort gui_nodes by order_priority field if it exists
-        sorted_gui_nodes = sorted(
-            gui_nodes.items(), key=lambda item: item[1].get("order_priority", 0)
-        )
-
-        for id, node in sorted_gui_nodes:
-            node_widget = WorkflowNodeWidget(id, node)
-            layout.addWidget(node_widget)
-
-            # Add spacing between nodes
-            layout.addSpacing(2)
-            self._node_widgets.append(node_widget)
+        self._node_widgets_by_id = {}
+        self._node_widgets_by_title = {}
+        self._node_widgets_layout = layout
+        self._pending_gui_nodes = list(gui_nodes)
 
         # Set the layout
         container.setLayout(layout)
@@ -581,6 +752,75 @@ class WorkflowsWidget(QWidget):
         # Set the container as the settings tab content
         self.set_settings_content(container)
 
+        if self.tab_widget.currentWidget() is self.settings_tab:
+            self._schedule_node_widget_batch()
+
+    def _on_tab_changed(self, index):
+        """Start building any pending node widgets when the Settings tab is shown."""
+        if self.tab_widget.widget(index) is self.settings_tab:
+            self._schedule_node_widget_batch()
+
+    def _schedule_node_widget_batch(self):
+        """Create the next batch of pending node widgets from the event loop."""
+        if self._pending_gui_nodes and not self._node_widget_batch_scheduled:
+            self._node_widget_batch_scheduled = True
+            QTimer.singleShot(0, self._create_next_node_widget_batch)
+
+    def _create_next_node_widget_batch(self):
+        """Create a batch of node widgets and yield to the event loop between batches."""
+        self._node_widget_batch_scheduled = False
+        self._create_node_widgets(self.NODE_WIDGET_BATCH_SIZE)
+        self._schedule_node_widget_batch()
+
+    def _ensure_node_widgets(self):
+        """Create all node widgets that have not been built yet."""
+        self._create_node_widgets()
+
+    def _create_node_widgets(self, count=None):
+        """Create widgets for up to count pending GUI nodes, or all if count is None."""
+        if not self._pending_gui_nodes:
+            return
+
+        if count is None:
+            count = len(self._pending_gui_nodes)
+        batch = self._pending_gui_nodes[:count]
+        del self._pending_gui_nodes[:count]
+        # Lay out and paint the batch once rather than after every widget
+        self._settings_widget.setUpdatesEnabled(False)
+        try:
+            for id, node in batch:
+                node_widget = WorkflowNodeWidget(id, node)
+                self._node_widgets_layout.addWidget(node_widget)
+
+                # Add spacing between nodes
+                self._node_widgets_layout.addSpacing(2)
+                self._node_widgets.append(node_widget)
+                self._node_widgets_by_id[id] = node_widget
+
+                # Index by normalized title for matching dropped metadata
+                title = node.get("inputs", {}).get("title", "")
+                self._node_widgets_by_title.setdefault(
+                    MetadataHandler.normalize_key(title), []
+                ).append(node_widget)
+        finally:
+            self._settings_widget.setUpdatesEnabled(True)
+
+    def _set_node_widget_values(self, values):
+        """Set the values of several node widgets with a single repaint.
+
+        Args:
+            values: List of (node_widget, value) pairs
+        """
+        if not values:
+            return
+
+        self._settings_widget.setUpdatesEnabled(False)
+        try:
+            for node_widget, value in values:
+                node_widget.set_node_widget_value(value, self._output_root)
+        finally:
+            self._settings_widget.setUpdatesEnabled(True)
+
     def load_workflow_and_settings_from_job(self, job):
         """
         Load a workflow and its settings from a job object.
@@ -602,27 +842,22 @@ class WorkflowsWidget(QWidget):
             workflow = job.get("workflow", None)
 
         # Import settings from the job's workflow data
-        if workflow and hasattr(self, "_node_widgets"):
+        if workflow:
+            self._ensure_node_widgets()
             # Update each node widget with values from the job's workflow
-            for node_widget in self._node_widgets:
-                if not hasattr(node_widget, "id"):
+            values = []
+            for node_id, node_data in workflow.items():
+                node_widget = self._node_widgets_by_id.get(node_id)
+                if node_widget is None:
                     continue
 
-                node_id = node_widget.id
-                if node_id in workflow:
-                    node_data = workflow[node_id]
+                # Get the value from the workflow
+                value = node_data["inputs"].get(node_widget.input_key or "value")
 
-                    # Get the value from the workflow
-                    if node_data["class_type"] == "SwarmInputImage":
-                        value = node_data["inputs"].get("image")
-                    elif node_data["class_type"] == "SwarmInputVideo":
-                        value = node_data["inputs"].get("video")
-                    else:
-                        value = node_data["inputs"].get("value")
-
-                    # Update the node widget with the value
-                    if value is not None:
-                        node_widget.set_node_widget_value(value, self._output_root)
+                # Update the node widget with the value
+                if value is not None:
+                    values.append((node_widget, value))
+            self._set_node_widget_values(values)
 
     def _import_settings_from_dropped_file(self, filename):
         """Import settings from a dropped file and update NodeWidgets.
@@ -638,44 +873,64 @@ class WorkflowsWidget(QWidget):
         Args:
             filename: Path to the dropped file
         """
-        handler = MetadataHandler()
-
-        # Load metadata from the file
-        metadata = handler.load_file_metadata(filename)
-        if not metadata or type(metadata) is not dict or "error" in metadata:
-            print(f"Error loading metadata from {filename}")
+        # Load the flattened metadata from the file
+        extracted_values = self._get_flat_metadata(filename)
+        if extracted_values is None:
+            logger.error("Error loading metadata from %s", filename)
             return
 
-        # flatten the metadata
-        extracted_values = MetadataHandler.flatten(metadata)
-
         # Check if there is a workflow_name value in the metadata
         # If found, search for and load that workflow before proceeding
-        # print(extracted_values)
+        logger.debug("Metadata values from %s: %s", filename, extracted_values)
         workflow_name = extracted_values.get("workflow_name")
-        if workflow_name and (
-            not hasattr(self, "_workflow_data_filename")
-            or self._workflow_data_filename != workflow_name
-        ):
+        if workflow_name and self._workflow_data_filename != workflow_name:
             self._load_workflow_by_name(workflow_name)
 
-        # if we still do not have widgets then return
-        if not hasattr(self, "_node_widgets"):
-            return
+        self._ensure_node_widgets()
 
-        # Update NodeWidgets with matching values
-        for node_widget in self._node_widgets:
-            if not hasattr(node_widget, "node_data"):
-                continue
+        # Index the metadata once so each widget title is a single lookup
+        metadata_index = MetadataHandler.build_metadata_index(extracted_values)
 
-            node_data = node_widget.node_data
-            inputs = node_data.get("inputs", {})
-            value = MetadataHandler.find_metadata_for_key(
-                inputs.get("title", ""), extracted_values
-            )
+        # Update NodeWidgets with matching values, using the titles that were
+        # normalized when the widgets were created
+        values = []
+        for title, node_widgets in self._node_widgets_by_title.items():
+            value = metadata_index.get(title)
             if value is not None:
-                node_widget.set_node_widget_value(value, self._output_root)
+                values.extend((node_widget, value) for node_widget in node_widgets)
+        self._set_node_widget_values(values)
 
+    def _get_flat_metadata(self, filename):
+        """Load and flatten the metadata of a file, reusing earlier results.
+
+        Results are cached by path, modification time and size so dropping
+        the same unchanged file again skips loading and flattening.
+
+        Args:
+            filename: Path to the image or video file
+
+        Returns:
+            The flattened metadata dictionary, or None if it could not be loaded
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        key = (filename, stat.st_mtime_ns, stat.st_size)
+        extracted_values = self._flat_metadata_cache.get(key)
+        if extracted_values is not None:
+            return extracted_values
+
+        metadata = self._metadata_handler.load_file_metadata(filename)
+        if not metadata or type(metadata) is not dict or "error" in metadata:
+            return None
+
+        extracted_values = MetadataHandler.flatten(metadata)
+        if len(self._flat_metadata_cache) >= self.FLAT_METADATA_CACHE_SIZE:
+            # Drop the oldest entry
+            del self._flat_metadata_cache[next(iter(self._flat_metadata_cache))]
+        self._flat_metadata_cache[key] = extracted_values
+        return extracted_values
 
     def dragEnterEvent(self, event):
         """Handle drag enter event for the settings tab."""
@@ -704,7 +959,7 @@ class WorkflowsWidget(QWidget):
         # Check if this is a job widget being dropped
         if mime_data.hasFormat("application/x-job-widget"):
             # Get the job data from the MIME data
-            job_data = json.loads(bytes(mime_data.data("application/x-job-widget")).decode('utf-8'))
+            job_data = json_loads(bytes(mime_data.data("application/x-job-widget")))
             self.load_workflow_and_settings_from_job(job_data)
             
         # Check if this is a file being dropped
@@ -724,14 +979,17 @@ class WorkflowsWidget(QWidget):
         Args:
             directory: Path to the workflows directory
         """
+        # Nothing to do if the tree already shows this directory
+        if (
+            directory == self.workflows_directory
+            and self.workflows_tree.topLevelItemCount() > 0
+        ):
+            return
+
         self.workflows_directory = directory
         # Clear and repopulate the existing tree with the new directory
-        if hasattr(self, "workflows_tree"):
-            self.workflows_tree.clear()
-            self._populate_workflows_tree()
-        else:
-            # If tree doesn't exist yet, initialize it
-            self._initialize_workflows_tree()
+        self.workflows_tree.clear()
+        self._populate_workflows_tree()
 
     # ── Presets ─────────────────────────────────────────────────────────
 
@@ -741,7 +999,7 @@ class WorkflowsWidget(QWidget):
         The file lives next to the workflows directory so that it persists
         across sessions.
         """
-        workflows_dir = getattr(self, "workflows_directory", "workflows")
+        workflows_dir = self.workflows_directory
         return os.path.join(os.path.dirname(workflows_dir) if os.path.dirname(workflows_dir) else ".", self.PRESETS_FILENAME)
 
     def _load_presets_from_file(self):
@@ -754,7 +1012,7 @@ class WorkflowsWidget(QWidget):
                 if isinstance(data, dict):
                     self._presets = data
             except Exception as e:
-                print(f"Error loading presets from {path}: {e}")
+                logger.error("Error loading presets from %s: %s", path, e)
 
     def _save_presets_to_file(self):
         """Persist the current ``_presets`` dictionary to presets.json."""
@@ -763,7 +1021,7 @@ class WorkflowsWidget(QWidget):
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(self._presets, f, indent=2)
         except Exception as e:
-            print(f"Error saving presets to {path}: {e}")
+            logger.error("Error saving presets to %s: %s", path, e)
 
     @staticmethod
     def _sanitize_preset_name(name: str) -> str:
@@ -772,7 +1030,7 @@ class WorkflowsWidget(QWidget):
 
     def _save_preset(self):
         """Prompt the user for a name and save the current workflow + settings as a preset."""
-        if not hasattr(self, "_workflow_data") or not hasattr(self, "_workflow_data_filename"):
+        if self._workflow_data is None or self._workflow_data_filename is None:
             QMessageBox.warning(self, "No Workflow", "Please load a workflow before saving a preset.")
             return
 
@@ -875,29 +1133,43 @@ class WorkflowsWidget(QWidget):
         self._save_presets_to_file()
         self._refresh_presets_list()
 
+    def _on_queue_count_edited(self):
+        """Validate the queue count once editing finishes and cache it."""
+        text = self._queue_count.text().strip()
+        if text and check_int(text) and int(text) > 0:
+            self._queue_count_value = int(text)
+        self._queue_count.setText(str(self._queue_count_value))
+
+    def _on_queue_clicked(self):
+        self._queue_job(self._queue_count_value)
+
     def _queue_job(self, count):
         workflow = self._update_workflow_with_gui_values()
 
-        # print(workflow)
+        logger.debug("Queueing workflow: %s", workflow)
         # Emit the job_queued signal with the workflow data and count
         self.job_queued.emit(self._workflow_data_filename, workflow, count)
 
     def _update_workflow_with_gui_values(self):
-        workflow = copy.deepcopy(self._workflow_data)
+        # Only the top level and inputs of nodes backed by a widget get written
+        # to, so copy just those dicts and share the rest with _workflow_data
+        workflow = dict(self._workflow_data)
+        self._ensure_node_widgets()
         for node_widget in self._node_widgets:
             id = node_widget.id
-            if workflow[id]["class_type"] == "SwarmInputImage":
-                workflow[id]["inputs"]["image"] = node_widget.get_value()
-                workflow[id]["input_width"] = node_widget.input_width
-                workflow[id]["input_height"] = node_widget.input_height
-            elif workflow[id]["class_type"] == "SwarmInputVideo":
-                workflow[id]["inputs"]["video"] = node_widget.get_value()
-                workflow[id]["input_width"] = node_widget.input_width
-                workflow[id]["input_height"] = node_widget.input_height
-            elif workflow[id]["class_type"] == "SwarmLoraLoader":
-                value = node_widget.get_value()
-                workflow[id]["inputs"]["lora_names"] = list(value.keys())
-                workflow[id]["inputs"]["lora_weights"] = list(value.values())
+            node = dict(workflow[id])
+            inputs = dict(node["inputs"])
+            node["inputs"] = inputs
+            workflow[id] = node
+            value = node_widget.get_value()
+            input_key = node_widget.input_key
+            if input_key is None:
+                # LoRA loaders store their names and weights separately
+                inputs["lora_names"] = list(value.keys())
+                inputs["lora_weights"] = list(value.values())
             else:
-                workflow[id]["inputs"]["value"] = node_widget.get_value()
+                inputs[input_key] = value
+                if input_key != "value":
+                    node["input_width"] = node_widget.input_width
+                    node["input_height"] = node_widget.input_height
         return workflow
@@ -4,56 +4,54 @@ This module provides a customizable directory tree widget that supports
 folder navigation, filtering, and key-based navigation between folders.
 """
 
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, Optional
 
-from core.utils import is_directory_empty
-from PySide6.QtCore import QDir, QPersistentModelIndex, QSortFilterProxyModel, Qt
+from PySide6.QtCore import QDir, QPersistentModelIndex, QSignalBlocker, Qt
 from PySide6.QtWidgets import QFileSystemModel, QTreeView
 
+logger = logging.getLogger(__name__)
 
-class FileProxyModel(QSortFilterProxyModel):
-    """Custom proxy model for filtering directory tree items.
 
-    This model filters out sibling directories when a specific directory
-    is selected, providing a cleaner navigation experience by showing only
-    the selected directory and its children.
-    """
+@dataclass
+class _PruneFrame:
+    """A directory being pruned on the prune_empty_directories stack."""
 
-    def setIndexPath(self, index):
-        """Set the current index path for filtering.
+    parent_fd: Optional[int]
+    name: str
+    directory: str
+    dir_fd: Optional[int]
+    subdirs: Iterator[str]
+    # Set once the directory is known not to be empty
+    keep: bool
 
-        This method sets the reference index for filtering and invalidates
-        the filter to trigger a re-evaluation of which rows should be shown.
 
-        Args:
-            index: The index to use as the reference point for filtering.
-        """
-        self._index_path = index
-        self.invalidateFilter()
+class DirectoryTree(QTreeView):
+    """A custom directory tree widget for browsing and selecting folders."""
 
-    def filterAcceptsRow(self, sourceRow, sourceParent):
-        """Filter rows to show only the selected directory and its children.
+    # Threads used to prune sibling directory subtrees in parallel
+    PRUNE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-        This method implements the filtering logic to hide sibling directories
-        at the same level as the selected directory, creating a focused view
-        of the directory hierarchy.
+    # Swarm metadata files that are removed along with an empty directory
+    SWARM_METADATA_FILES = ("swarm_metadata.ldb", "swarm_metadata-log.ldb")
 
-        Args:
-            sourceRow: The row index in the source model.
-            sourceParent: The parent index in the source model.
+    # Prune relative to open directory file descriptors where the platform
+    # supports it, so the kernel doesn't resolve the full path on every call
+    USE_DIR_FD = (
+        hasattr(os, "O_DIRECTORY")
+        and {os.open, os.rmdir, os.unlink} <= os.supports_dir_fd
+        and os.scandir in os.supports_fd
+    )
 
-        Returns:
-            bool: True if the row should be shown, False otherwise.
-        """
-        if hasattr(self, "_index_path"):
-            ix = self.sourceModel().index(sourceRow, 0, sourceParent)
-            if self._index_path.parent() == sourceParent and self._index_path != ix:
-                return False
-        return super(FileProxyModel, self).filterAcceptsRow(sourceRow, sourceParent)
-
-
-class DirectoryTree(QTreeView):
-    """A custom directory tree widget for browsing and selecting folders."""
+    # Navigation keys: W goes to the previous folder, S to the next one
+    _KEY_HANDLERS = {
+        int(Qt.Key.Key_W): "navigate_to_previous_folder",
+        int(Qt.Key.Key_S): "navigate_to_next_folder",
+    }
 
     def __init__(self, parent=None):
         """Initialize the DirectoryTree widget.
@@ -63,6 +61,9 @@ class DirectoryTree(QTreeView):
         """
         super().__init__(parent)
 
+        # Folder last opened with open_root_folder
+        self._root_folder = ""
+
         # Create file system model for the directory tree
         self._file_system_model = QFileSystemModel()
         self._file_system_model.setRootPath("")
@@ -71,35 +72,42 @@ class DirectoryTree(QTreeView):
         )
         # self._file_system_model.setFilter(QDir.Filter.AllDirs)
 
-        self._proxy = FileProxyModel(self)
-        self._proxy.setSourceModel(self._file_system_model)
-        self.setModel(self._proxy)
+        # Only directory names are shown, so skip symlink resolution and
+        # custom icon lookups that stat every entry. Change watching stays
+        # on so pruned or newly written folders show up in the tree.
+        self._file_system_model.setOption(
+            QFileSystemModel.Option.DontResolveSymlinks, True
+        )
+        self._file_system_model.setOption(
+            QFileSystemModel.Option.DontUseCustomDirectoryIcons, True
+        )
+        self._file_system_model.setReadOnly(True)
+
+        # The view's root is the parent of the opened folder, with the
+        # folder's siblings hidden so only the folder itself shows at the top
+        self._root_folder_index = QPersistentModelIndex()
+        self._root_folder_parent = QPersistentModelIndex()
+        self._file_system_model.rowsInserted.connect(self._on_rows_inserted)
+
+        self.setModel(self._file_system_model)
 
-        # Configure the tree view
+        # Configure the tree view, hiding the header
         self.setHeaderHidden(True)
         self.setMinimumWidth(100)
+        # Every row is a single line folder name
+        self.setUniformRowHeights(True)
 
-        # Hide all columns except the name column
-        self.setColumnHidden(1, True)  # Hide size column
-        self.setColumnHidden(2, True)  # Hide type column
-        self.setColumnHidden(3, True)  # Hide date
-
-        # Hide the header
-        self.header().hide()
+        # Hide the size, type and date columns in one pass over the header
+        header = self.header()
+        with QSignalBlocker(header):
+            for column in (1, 2, 3):
+                header.setSectionHidden(column, True)
 
         # Set column width for the name column
         self.setColumnWidth(0, 80)
 
     def __del__(self):
         """Destructor to clean up resources and prevent memory leaks."""
-        # Clean up the proxy model first
-        if hasattr(self, '_proxy') and self._proxy is not None:
-            try:
-                # Schedule the proxy model for deletion
-                self._proxy.deleteLater()
-            except Exception as e:
-                print(f"Error cleaning up proxy model: {e}")
-
         # Clean up the file system model
         if hasattr(self, '_file_system_model') and self._file_system_model is not None:
             try:
@@ -136,67 +144,101 @@ class DirectoryTree(QTreeView):
         folder_index = self._file_system_model.index(folder_path)
 
         if folder_index.isValid():
-            # Map to proxy model
-            proxy_folder_index = self._proxy.mapFromSource(folder_index)
-            
-            # Expand all directories in the path
-            self._expand_all_directories(proxy_folder_index)
+            # Expand the folder to show its subdirectories, deeper levels
+            # are only read when the user expands them
+            self.expand(folder_index)
             
             # Select the folder
-            self.setCurrentIndex(proxy_folder_index)
+            self.setCurrentIndex(folder_index)
             
             # Scroll to make it visible
-            self.scrollTo(proxy_folder_index)
+            self.scrollTo(folder_index)
             
             # Fire the clicked signal
-            self.clicked.emit(proxy_folder_index)
+            self.clicked.emit(folder_index)
 
-    def open_root_folder(self, folder_path: str) -> None:
+    def open_root_folder(self, folder_path: str) -> bool:
         """Open a folder from a given path.
 
         Args:
             folder_path (str): Path to the folder to open.
+
+        Returns:
+            bool: True if the folder was opened, False if it isn't a directory.
         """
+        # Check if the path is a valid directory
+        if not os.path.isdir(folder_path):
+            return False
+
         self._root_folder = folder_path
 
-        # Check if the path is a valid directory
-        if os.path.isdir(folder_path):
-            parent_dir = os.path.abspath(os.path.join(folder_path, os.pardir))
-            # Set the root path to the parent directory
-            self._file_system_model.setRootPath(parent_dir)
+        # Keep the view from repainting after every step below, it is
+        # redrawn once with the final state
+        self.setUpdatesEnabled(False)
+        try:
+            parent_dir = os.path.dirname(os.path.abspath(folder_path))
+            # Set the root path to the parent directory, which also returns
+            # its index
+            parent_index = self._file_system_model.setRootPath(parent_dir)
 
             # Set root index to show the folder and its children
             folder_index = self._file_system_model.index(folder_path)
 
-            self._proxy.setIndexPath(QPersistentModelIndex(folder_index))
-            self.setRootIndex(
-                self._proxy.mapFromSource(self._file_system_model.index(parent_dir))
-            )
+            self.setRootIndex(parent_index)
+            self._set_root_folder_index(folder_index)
 
             # Find and expand the specific folder
             if folder_index.isValid():
-                proxy_folder_index = self._proxy.mapFromSource(folder_index)
-                # Expand all directories under the root
-                self._expand_all_directories(proxy_folder_index)
+                # Expand the folder to show its subdirectories, deeper
+                # levels are only read when the user expands them
+                self.expand(folder_index)
                 # Select the folder
-                self.setCurrentIndex(proxy_folder_index)
+                self.setCurrentIndex(folder_index)
                 # Scroll to make it visible
-                self.scrollTo(proxy_folder_index)
-                # Fire the clicked signal
-                self.clicked.emit(proxy_folder_index)
-
-    def _expand_all_directories(self, index):
-        """Recursively expand all directories starting from the given index."""
-        # Expand the current index
-        self.setExpanded(index, True)
-
-        # Iterate through all children
-        source_index = self._proxy.mapToSource(index)
-        for row in range(self._file_system_model.rowCount(source_index)):
-            child_index = self._file_system_model.index(row, 0, source_index)
-            # If the child is a directory, expand it
-            if self._file_system_model.isDir(child_index):
-                self._expand_all_directories(self._proxy.mapFromSource(child_index))
+                self.scrollTo(folder_index)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Fire the clicked signal once the tree is in its final state
+        if folder_index.isValid():
+            self.clicked.emit(folder_index)
+        return True
+
+    def _set_root_folder_index(self, folder_index) -> None:
+        """Show only the given folder among its siblings.
+
+        Args:
+            folder_index: Model index of the opened root folder.
+        """
+        # Show the siblings of the previous root folder again
+        old_parent = self._root_folder_parent
+        if old_parent.isValid():
+            for row in range(self._file_system_model.rowCount(old_parent)):
+                self.setRowHidden(row, old_parent, False)
+
+        self._root_folder_index = QPersistentModelIndex(folder_index)
+        self._root_folder_parent = QPersistentModelIndex(folder_index.parent())
+        if folder_index.isValid():
+            self._hide_root_folder_siblings(
+                0, self._file_system_model.rowCount(self._root_folder_parent) - 1
+            )
+
+    def _hide_root_folder_siblings(self, first: int, last: int) -> None:
+        """Hide the rows in a range that are siblings of the root folder.
+
+        Args:
+            first (int): First row to update.
+            last (int): Last row to update.
+        """
+        parent = self._root_folder_parent
+        folder_row = self._root_folder_index.row()
+        for row in range(first, last + 1):
+            self.setRowHidden(row, parent, row != folder_row)
+
+    def _on_rows_inserted(self, parent, first: int, last: int) -> None:
+        """Hide directories that appear next to the root folder."""
+        if self._root_folder_parent.isValid() and parent == self._root_folder_parent:
+            self._hide_root_folder_siblings(first, last)
 
     def get_selected_folder_path(self) -> str:
         """Get the path of the currently selected folder.
@@ -206,7 +248,7 @@ class DirectoryTree(QTreeView):
         """
         index = self.currentIndex()
         if index.isValid():
-            return self._file_system_model.filePath(self._proxy.mapToSource(index))
+            return self._file_system_model.filePath(index)
         return ""
 
     def get_folder_path_from_index(self, index) -> str:
@@ -219,169 +261,51 @@ class DirectoryTree(QTreeView):
             str: Path to the selected folder, or empty string if none selected.
         """
         if index.isValid():
-            return self._file_system_model.filePath(self._proxy.mapToSource(index))
+            return self._file_system_model.filePath(index)
         return ""
 
     def navigate_to_previous_folder(self):
         """Navigate to the previous folder in the directory tree."""
-        # Get the current root folder
-        root_path = self._file_system_model.rootPath()
-        if not root_path:
-            return
-
-        # Get the current root index
-        root_index = self.rootIndex()
-        if not root_index.isValid():
-            return
-
-        # Find the currently selected index
-        current_index = self.currentIndex()
-
-        # If no selection, start from the root
-        if not current_index.isValid():
-            current_index = root_index
-
-        # Get the parent of the current index
-        parent_index = current_index.parent()
-
-        # If we're at root level, try to select the previous sibling
-        if not parent_index.isValid():
-            parent_index = root_index
-
-        # Get the row of the current index
-        current_row = current_index.row()
-
-        # Try to select the previous sibling
-        prev_row = current_row - 1
-        model_parent_index = self._proxy.mapToSource(parent_index)
-        if prev_row >= 0 and prev_row < self._file_system_model.rowCount(
-            model_parent_index
-        ):
-            prev_index = self._file_system_model.index(prev_row, 0, model_parent_index)
-
-            # If it's a directory, select it
-            if self._file_system_model.isDir(prev_index):
-                proxy_prev_index = self._proxy.mapFromSource(prev_index)
-                self.setCurrentIndex(proxy_prev_index)
-                self.scrollTo(proxy_prev_index)
-                # Fire the clicked signal
-                self.clicked.emit(proxy_prev_index)
-                return proxy_prev_index
-
-        # If we're at the start of the current level, try to go to parent's previous sibling
-        # or recursively check parent levels
-        def find_previous_folder(index):
-            """Recursively find the previous folder at any level."""
-            while index.isValid():
-                parent = index.parent()
-                parent_row = index.row()
-
-                # Try to find previous sibling at current level
-                if parent.isValid():
-                    prev_sibling_row = parent_row - 1
-                    if (
-                        prev_sibling_row >= 0
-                        and prev_sibling_row < self._file_system_model.rowCount(parent)
-                    ):
-                        prev_sibling = self._file_system_model.index(
-                            prev_sibling_row, 0, parent
-                        )
-                        if self._file_system_model.isDir(prev_sibling):
-                            return prev_sibling
-
-                # Move up to parent
-                index = parent
-
-            return None
-
-        # Try to find previous folder
-        prev_folder = find_previous_folder(model_parent_index)
-        if prev_folder and prev_folder.isValid():
-            proxy_prev_index = self._proxy.mapFromSource(prev_folder)
-            self.setCurrentIndex(proxy_prev_index)
-            self.scrollTo(proxy_prev_index)
-            # Fire the clicked signal
-            self.clicked.emit(proxy_prev_index)
-            return proxy_prev_index
-
-        return None
+        return self._navigate_to_sibling_folder(-1)
 
     def navigate_to_next_folder(self):
         """Navigate to the next folder in the directory tree."""
-        # Get the current root folder
-        root_path = self._file_system_model.rootPath()
-        if not root_path:
-            return
+        return self._navigate_to_sibling_folder(1)
 
-        # Get the current root index
-        root_index = self.rootIndex()
-        if not root_index.isValid():
-            return
+    def _navigate_to_sibling_folder(self, step: int):
+        """Select the nearest sibling folder in the given direction.
 
-        # Find the currently selected index
-        current_index = self.currentIndex()
-
-        # If no selection, start from the root
-        if not current_index.isValid():
-            current_index = root_index
-
-        # Get the parent of the current index
-        parent_index = current_index.parent()
-
-        # If we're at root level, try to select the next sibling
-        if not parent_index.isValid():
-            parent_index = root_index
-
-        # Get the row of the current index
-        current_row = current_index.row()
-
-        # Try to select the next sibling
-        next_row = current_row + 1
-        model_parent_index = self._proxy.mapToSource(parent_index)
-        if next_row < self._file_system_model.rowCount(model_parent_index):
-            next_index = self._file_system_model.index(next_row, 0, model_parent_index)
-
-            # If it's a directory, select it
-            if self._file_system_model.isDir(next_index):
-                proxy_next_index = self._proxy.mapFromSource(next_index)
-                self.setCurrentIndex(proxy_next_index)
-                self.scrollTo(proxy_next_index)
-                # Fire the clicked signal
-                self.clicked.emit(proxy_next_index)
-                return proxy_next_index
-
-        # If we're at the end of the current level, try to go to parent's next sibling
-        # or recursively check parent levels
-        def find_next_folder(index):
-            """Recursively find the next folder at any level."""
-            while index.isValid():
-                parent = index.parent()
-                parent_row = index.row()
-
-                # Try to find next sibling at current level
-                if parent.isValid():
-                    next_sibling_row = parent_row + 1
-                    if next_sibling_row < self._file_system_model.rowCount(parent):
-                        next_sibling = self._file_system_model.index(
-                            next_sibling_row, 0, parent
-                        )
-                        if self._file_system_model.isDir(next_sibling):
-                            return next_sibling
+        Tries the sibling of the selected folder first, then the siblings of
+        its parent folders, without leaving the opened root folder. Only the
+        model's in-memory tree is walked, so no directories are read.
 
-                # Move up to parent
-                index = parent
+        Args:
+            step (int): -1 for the previous folder, 1 for the next one.
 
+        Returns:
+            The index of the newly selected folder, or None if there is none.
+        """
+        root_index = self.rootIndex()
+        if not root_index.isValid():
             return None
 
-        # Try to find next folder
-        next_index = find_next_folder(model_parent_index)
-        if next_index and next_index.isValid():
-            proxy_next_index = self._proxy.mapFromSource(next_index)
-            self.setCurrentIndex(proxy_next_index)
-            self.scrollTo(proxy_next_index)
-            # Fire the clicked signal
-            self.clicked.emit(proxy_next_index)
-            return proxy_next_index
+        index = self.currentIndex()
+        while index.isValid() and index != root_index:
+            parent = index.parent()
+            row = index.row() + step
+
+            # The model only lists directories, so any sibling is a folder
+            if row >= 0 and not self.isRowHidden(row, parent):
+                sibling = index.siblingAtRow(row)
+                if sibling.isValid():
+                    self.setCurrentIndex(sibling)
+                    self.scrollTo(sibling)
+                    # Fire the clicked signal
+                    self.clicked.emit(sibling)
+                    return sibling
+
+            # Move up to parent
+            index = parent
 
         return None
 
@@ -408,48 +332,188 @@ class DirectoryTree(QTreeView):
             return 0
 
         removed_count = 0
-
-        def _prune_recursive(directory):
-            """Recursively prune empty directories using depth-first approach.
-
-            This inner function implements the depth-first traversal:
-            - Processes all children first
-            - Then checks if the current directory is empty
-            - Removes it if empty
+        count_lock = threading.Lock()
+        use_dir_fd = self.USE_DIR_FD
+
+        # Without dir_fd support directories are opened and removed by full
+        # path, and the file descriptor is None
+        def _open(parent_fd, name):
+            """Open a directory relative to its parent's file descriptor."""
+            if not use_dir_fd:
+                return None
+            return os.open(name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=parent_fd)
+
+        def _child_name(dir_fd, directory, name):
+            """Return how to refer to an entry of a directory in a syscall."""
+            return name if dir_fd is not None else os.path.join(directory, name)
+
+        def _scan(dir_fd, directory):
+            """Scan a directory once for its subdirectories and other entries.
+
+            Hidden directories and swarm metadata files don't stop a directory
+            from counting as empty, matching is_directory_empty.
+
+            Returns:
+                Tuple of (subdir_names, has_other_entries), or None if the
+                directory could not be read
             """
+            subdirs = []
+            has_other_entries = False
+            target = directory if dir_fd is None else dir_fd
+            try:
+                # A directory's link count is 2 plus its number of
+                # subdirectories on most filesystems (others report 1), so
+                # for a leaf the scan can stop at the first other entry
+                is_leaf = os.stat(target).st_nlink == 2
+                with os.scandir(target) as entries:
+                    for entry in entries:
+                        if is_leaf:
+                            if entry.name not in self.SWARM_METADATA_FILES:
+                                has_other_entries = True
+                                break
+                        elif entry.is_dir():
+                            if not entry.name.startswith("."):
+                                subdirs.append(entry.name)
+                        elif entry.name not in self.SWARM_METADATA_FILES:
+                            has_other_entries = True
+            except (OSError, PermissionError):
+                return None
+            return subdirs, has_other_entries
+
+        def _remove_empty(dir_fd, parent_fd, name, directory):
+            """Remove an empty directory along with its swarm metadata files."""
             nonlocal removed_count
 
-            # Get all subdirectories
             try:
-                entries = list(os.scandir(directory))
-            except (OSError, PermissionError):
-                return
+                # Remove swarm metadata files before removing the directory
+                for ldb_file in self.SWARM_METADATA_FILES:
+                    try:
+                        os.unlink(
+                            _child_name(dir_fd, directory, ldb_file), dir_fd=dir_fd
+                        )
+                    except FileNotFoundError:
+                        pass
+                    except (OSError, PermissionError) as e:
+                        logger.debug(
+                            "Error removing %s in %s: %s", ldb_file, directory, e
+                        )
+
+                # Remove the now-empty directory
+                os.rmdir(name, dir_fd=parent_fd)
+                with count_lock:
+                    removed_count += 1
+                return True
+            except (OSError, PermissionError) as e:
+                logger.debug("Error removing directory %s: %s", directory, e)
+                return False
+
+        def _prune_tree(parent_fd, name, directory):
+            """Prune empty directories depth-first using an explicit stack.
 
-            # Process subdirectories first (depth-first)
-            for entry in entries:
-                if entry.is_dir() and not entry.name.startswith("."):
-                    _prune_recursive(entry.path)
+            Each directory is scanned when first reached and, once all of its
+            subdirectories are done, removed if it is empty. An explicit stack
+            avoids Python recursion limits on deep trees.
 
-            # After processing subdirectories, check if current directory is empty
-            if is_directory_empty(directory):
+            Returns:
+                True if the directory was removed
+            """
+            stack = []
+
+            def _enter(parent_fd, name, directory):
                 try:
-                    # Remove swarm metadata files before removing the directory
-                    for ldb_file in ["swarm_metadata.ldb", "swarm_metadata-log.ldb"]:
-                        ldb_path = os.path.join(directory, ldb_file)
-                        if os.path.exists(ldb_path):
-                            try:
-                                os.remove(ldb_path)
-                            except (OSError, PermissionError) as e:
-                                print(f"Error removing {ldb_file} in {directory}: {e}")
-
-                    # Remove the now-empty directory
-                    os.rmdir(directory)
-                    removed_count += 1
-                except (OSError, PermissionError) as e:
-                    print(f"Error removing directory {directory}: {e}")
+                    dir_fd = _open(parent_fd, name)
+                except (OSError, PermissionError):
+                    return False
+                scan = _scan(dir_fd, directory)
+                if scan is None:
+                    if dir_fd is not None:
+                        os.close(dir_fd)
+                    return False
+                subdirs, has_other_entries = scan
+                stack.append(
+                    _PruneFrame(
+                        parent_fd,
+                        name,
+                        directory,
+                        dir_fd,
+                        iter(subdirs),
+                        has_other_entries,
+                    )
+                )
+                return True
+
+            if not _enter(parent_fd, name, directory):
+                return False
+
+            removed = False
+            try:
+                while stack:
+                    frame = stack[-1]
+
+                    # Process subdirectories first (depth-first)
+                    subdir = next(frame.subdirs, None)
+                    if subdir is not None:
+                        if not _enter(
+                            frame.dir_fd,
+                            _child_name(frame.dir_fd, frame.directory, subdir),
+                            os.path.join(frame.directory, subdir),
+                        ):
+                            frame.keep = True
+                        continue
+
+                    # The directory is empty if it had nothing else and every
+                    # subdirectory was removed, no need to scan it again
+                    stack.pop()
+                    try:
+                        removed = not frame.keep and _remove_empty(
+                            frame.dir_fd, frame.parent_fd, frame.name, frame.directory
+                        )
+                    finally:
+                        if frame.dir_fd is not None:
+                            os.close(frame.dir_fd)
+                    if not removed and stack:
+                        stack[-1].keep = True
+            finally:
+                # Only left over if an unexpected error stopped the traversal
+                for frame in stack:
+                    if frame.dir_fd is not None:
+                        os.close(frame.dir_fd)
+            return removed
+
+        try:
+            root_fd = _open(None, root_folder)
+        except (OSError, PermissionError):
+            return 0
 
-        # Start the recursive pruning
-        _prune_recursive(root_folder)
+        try:
+            scan = _scan(root_fd, root_folder)
+            if scan is None:
+                return 0
+            subdirs, has_other_entries = scan
+
+            # Sibling subtrees are independent, so prune them in parallel. The
+            # work is mostly filesystem syscalls, which release the GIL.
+            all_removed = True
+            if subdirs:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.PRUNE_WORKERS, len(subdirs))
+                ) as executor:
+                    results = executor.map(
+                        lambda subdir: _prune_tree(
+                            root_fd,
+                            _child_name(root_fd, root_folder, subdir),
+                            os.path.join(root_folder, subdir),
+                        ),
+                        subdirs,
+                    )
+                    all_removed = all(list(results))
+
+            # Finally the root folder itself
+            if not has_other_entries and all_removed:
+                _remove_empty(root_fd, None, root_folder, root_folder)
+        finally:
+            if root_fd is not None:
+                os.close(root_fd)
 
         return removed_count
 
@@ -459,12 +523,9 @@ class DirectoryTree(QTreeView):
         Args:
             event: QKeyEvent
         """
-        # Handle W key for navigating to previous folder
-        if event.key() == Qt.Key.Key_W:
-            self.navigate_to_previous_folder()
-        # Handle S key for navigating to next folder
-        elif event.key() == Qt.Key.Key_S:
-            self.navigate_to_next_folder()
+        handler = self._KEY_HANDLERS.get(event.key())
+        if handler:
+            getattr(self, handler)()
         else:
             # Call parent class handler for other keys
             super().keyPressEvent(event)
@@ -0,0 +1,122 @@
+"""Keybindings dialog for the viewer.
+
+Kept out of viewmain so the dialog and its table are only loaded the first
+time the keybindings are shown.
+"""
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QTextBrowser,
+    QVBoxLayout,
+)
+
+
+# Keybindings table shown by KeybindingsDialog
+_KEYBINDINGS_HTML = """
+<html>
+<head>
+    <style>
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        th, td {
+            padding: 8px;
+            text-align: left;
+            border-bottom: 1px solid #555;
+        }
+        th {
+            background-color: #333;
+            font-weight: bold;
+        }
+        tr:hover {
+            background-color: #444;
+        }
+    </style>
+</head>
+<body>
+    <table>
+        <tr>
+            <th>Action</th>
+            <th>Shortcut</th>
+        </tr>
+        <tr>
+            <td>Open Folder</td>
+            <td>Ctrl+O</td>
+        </tr>
+        <tr>
+            <td>Delete Marked Files</td>
+            <td>Ctrl+D</td>
+        </tr>
+        <tr>
+            <td>Prune Empty Directories</td>
+            <td>Ctrl+P</td>
+        </tr>
+        <tr>
+            <td>Exit Application</td>
+            <td>Ctrl+Q</td>
+        </tr>
+        <tr>
+            <td>Navigate to Previous Folder</td>
+            <td>W</td>
+        </tr>
+        <tr>
+            <td>Navigate to Next Folder</td>
+            <td>S</td>
+        </tr>
+        <tr>
+            <td>Previous Image/Video</td>
+            <td>A</td>
+        </tr>
+        <tr>
+            <td>Next Image/Video</td>
+            <td>D</td>
+        </tr>
+        <tr>
+            <td>Fit Image to Viewer</td>
+            <td>R</td>
+        </tr>
+        <tr>
+            <td>View Image at 1:1 Size</td>
+            <td>1</td>
+        </tr>
+        <tr>
+            <td>Mark Current File</td>
+            <td>X</td>
+        </tr>
+    </table>
+</body>
+</html>
+"""
+
+
+class KeybindingsDialog(QDialog):
+    """Dialog to display all keybindings for the application."""
+
+    def __init__(self, parent=None):
+        """Initialize the KeybindingsDialog.
+
+        Args:
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Keybindings")
+        self.setMinimumWidth(500)
+        self.setMinimumHeight(400)
+
+        # Create main layout
+        main_layout = QVBoxLayout(self)
+
+        # Create title
+        title = QLabel("Application Keybindings")
+        title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        main_layout.addWidget(title)
+
+        # Add keybindings information, the browser parses the table into its
+        # document once and scrolls it itself
+        info_browser = QTextBrowser()
+        info_browser.setHtml(_KEYBINDINGS_HTML)
+        main_layout.addWidget(info_browser)
+
+        self.setLayout(main_layout)
@@ -1,153 +1,127 @@
+import json
 import os
+import time
 
-from core.imagegallery import ImageGallery
+from core.imagegallery import ImageGallery, list_folder_images
 from core.imagevideoviewer import ImageVideoViewer
 from core.metadataviewer import MetadataViewer
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+)
 from PySide6.QtGui import (
     QAction,
     QColor,
     QGuiApplication,
+    QKeySequence,
     QPalette,
 )
 from PySide6.QtWidgets import (
     QApplication,
-    QDialog,
     QFileDialog,
-    QHBoxLayout,
     QLabel,
     QMainWindow,
     QMessageBox,
-    QScrollArea,
+    QProgressDialog,
     QSplitter,
     QStyleFactory,
-    QVBoxLayout,
-    QWidget,
 )
 
 from .directorytree import DirectoryTree
 
 
-class KeybindingsDialog(QDialog):
-    """Dialog to display all keybindings for the application."""
+# Viewer state kept between sessions
+_STATE_PATH = os.path.join(os.path.expanduser("~/.config/bowser"), "state.json")
 
-    def __init__(self, parent=None):
-        """Initialize the KeybindingsDialog.
+# Dark palette applied by ViewMain, built on first use since it needs a
+# QApplication
+_DARK_PALETTE = None
+
+
+def _build_dark_palette() -> QPalette:
+    """Build the dark palette used with the Fusion style.
+
+    Returns:
+        QPalette: The dark palette.
+    """
+    palette = QPalette()
+
+    # Base colors
+    palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
+    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
+
+    # Disabled colors
+    palette.setColor(
+        QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(128, 128, 128)
+    )
+    palette.setColor(
+        QPalette.ColorGroup.Disabled,
+        QPalette.ColorRole.ButtonText,
+        QColor(128, 128, 128),
+    )
+
+    return palette
+
+
+class PruneJobSignals(QObject):
+    """Signals emitted by a PruneJob."""
+
+    # root folder, number of directories removed
+    finished = Signal(str, int)
+
+
+class PruneJob(QRunnable):
+    """Prune empty directories below a folder on a worker thread."""
+
+    def __init__(self, directory_tree, root_path):
+        super().__init__()
+        self.directory_tree = directory_tree
+        self.root_path = root_path
+        self.signals = PruneJobSignals()
+
+    def run(self):
+        removed_count = self.directory_tree.prune_empty_directories(self.root_path)
+        self.signals.finished.emit(self.root_path, removed_count)
 
-        Args:
-            parent: Parent widget.
-        """
-        super().__init__(parent)
-        self.setWindowTitle("Keybindings")
-        self.setMinimumWidth(500)
-        self.setMinimumHeight(400)
-
-        # Create main layout
-        main_layout = QVBoxLayout(self)
-
-        # Create title
-        title = QLabel("Application Keybindings")
-        title.setStyleSheet("font-size: 16px; font-weight: bold;")
-        main_layout.addWidget(title)
-
-        # Create scroll area for keybindings
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-
-        # Create content widget
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Add keybindings information
-        keybindings_info = """
-        <html>
-        <head>
-            <style>
-                table {
-                    width: 100%;
-                    border-collapse: collapse;
-                }
-                th, td {
-                    padding: 8px;
-                    text-align: left;
-                    border-bottom: 1px solid #555;
-                }
-                th {
-                    background-color: #333;
-                    font-weight: bold;
-                }
-                tr:hover {
-                    background-color: #444;
-                }
-            </style>
-        </head>
-        <body>
-            <table>
-                <tr>
-                    <th>Action</th>
-                    <th>Shortcut</th>
-                </tr>
-                <tr>
-                    <td>Open Folder</td>
-                    <td>Ctrl+O</td>
-                </tr>
-                <tr>
-                    <td>Delete Marked Files</td>
-                    <td>Ctrl+D</td>
-                </tr>
-                <tr>
-                    <td>Prune Empty Directories</td>
-                    <td>Ctrl+P</td>
-                </tr>
-                <tr>
-                    <td>Exit Application</td>
-                    <td>Ctrl+Q</td>
-                </tr>
-                <tr>
-                    <td>Navigate to Previous Folder</td>
-                    <td>W</td>
-                </tr>
-                <tr>
-                    <td>Navigate to Next Folder</td>
-                    <td>S</td>
-                </tr>
-                <tr>
-                    <td>Previous Image/Video</td>
-                    <td>A</td>
-                </tr>
-                <tr>
-                    <td>Next Image/Video</td>
-                    <td>D</td>
-                </tr>
-                <tr>
-                    <td>Fit Image to Viewer</td>
-                    <td>R</td>
-                </tr>
-                <tr>
-                    <td>View Image at 1:1 Size</td>
-                    <td>1</td>
-                </tr>
-                <tr>
-                    <td>Mark Current File</td>
-                    <td>X</td>
-                </tr>
-            </table>
-        </body>
-        </html>
-        """
 
-        info_label = QLabel(keybindings_info)
-        info_label.setWordWrap(True)
-        content_layout.addWidget(info_label)
+class FolderScanJobSignals(QObject):
+    """Signals emitted by a FolderScanJob."""
 
-        # Add some spacing
-        content_layout.addStretch()
+    # folder path, image and video paths in the folder
+    scanned = Signal(str, list)
 
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
 
-        self.setLayout(main_layout)
+class FolderScanJob(QRunnable):
+    """List the images and videos in a folder on a worker thread."""
+
+    def __init__(self, folder_path):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = FolderScanJobSignals()
+
+    def run(self):
+        try:
+            image_paths = list_folder_images(self.folder_path)
+        except OSError as e:
+            print(f"Error reading folder {self.folder_path}: {e}")
+            image_paths = []
+        self.signals.scanned.emit(self.folder_path, image_paths)
 
 
 class ViewMain(QMainWindow):
@@ -175,6 +149,29 @@ class ViewMain(QMainWindow):
         self._marked_files = []
         self._last_file_path = ""
 
+        # Keybindings dialog, created the first time it is shown
+        self._keybindings_dialog = None
+
+        # Folder clicks are coalesced so that only the folder the user
+        # settles on gets loaded when stepping quickly through the tree
+        self._pending_folder = None
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(120)
+        self._load_timer.timeout.connect(self._flush_pending_folder)
+
+        # When the last refresh happened, to ignore repeated F5 presses
+        self._last_refresh_time = 0.0
+
+        # File to select once its folder has been scanned into the gallery
+        self._pending_show_file = None
+
+        # Busy dialog shown while empty directories are pruned
+        self._prune_progress = None
+
+        # Message box reused by the prune action, created on first use
+        self._message_box = None
+
         # Apply dark mode (Fusion style with dark palette)
         self._apply_dark_mode()
 
@@ -193,14 +190,18 @@ class ViewMain(QMainWindow):
         self._image_gallery = ImageGallery()
         self._image_gallery.setStyleSheet("border: 0px;")
 
-        # Connect thumbnail clicked signal
-        self._image_gallery.thumbnail_clicked.connect(self._on_thumbnail_clicked)
+        # Connect thumbnail clicked signal, queued so the gallery can paint
+        # the new selection before the file is decoded and displayed
+        self._image_gallery.thumbnail_clicked.connect(
+            self._on_thumbnail_clicked, Qt.ConnectionType.QueuedConnection
+        )
 
         # Connect status update signal
         self._image_gallery.status_update.connect(self.set_status_message)
 
         # 3. Image Video Viewer (handles both image and video viewing)
         self._image_video_viewer = ImageVideoViewer()
+        self._image_viewer = self._image_video_viewer.get_image_viewer()
 
         # Connect button signals
         self._image_video_viewer.connect_previous_button(self._on_previous_clicked)
@@ -218,46 +219,93 @@ class ViewMain(QMainWindow):
         self._main_splitter.addWidget(self._image_video_viewer)
         self._main_splitter.addWidget(self._metadata_display)
 
-        # Set initial sizes for the splitter
         # Third column (image/video viewer) gets extra space with stretch factor
-        self._main_splitter.setSizes([200, 420, 600, 400])
         self._main_splitter.setStretchFactor(0, 0)  # tree - no stretch
         self._main_splitter.setStretchFactor(1, 0)  # Gallery - no stretch
         self._main_splitter.setStretchFactor(2, 1)  # Viewer - gets extra space
         self._main_splitter.setStretchFactor(3, 0)  # metadata - no stretch
+        # Only lay the panes out again when a splitter drag ends
+        self._main_splitter.setOpaqueResize(False)
 
         # Create status label
         self._status_label = QLabel("Ready")
         self._status_label.setStyleSheet("color: #CCCCCC; padding: 2px 8px;")
 
-        # Create horizontal layout for menu bar
-        menu_layout = QHBoxLayout()
-        menu_layout.setContentsMargins(0, 0, 0, 0)
-        menu_layout.addWidget(self.menuBar())
-        menu_layout.addStretch()
-        menu_layout.addWidget(self._status_label)
-
-        # Create main vertical layout
-        main_container = QWidget()
-        main_layout = QVBoxLayout(main_container)
-        main_layout.addLayout(menu_layout)
-        main_layout.addWidget(self._main_splitter)
-        main_layout.setStretchFactor(self._main_splitter, 1)  # Splitter takes all extra space
-        main_container.setLayout(main_layout)
-
+        # Show the status label at the right end of the menu bar
+        self.menuBar().setCornerWidget(
+            self._status_label, Qt.Corner.TopRightCorner
+        )
 
-        self.setCentralWidget(main_container)
+        # The splitter fills the window below the menu bar
+        self.setCentralWidget(self._main_splitter)
 
         # Get screen size and calculate 60% of it
         screen_size = QGuiApplication.primaryScreen().availableSize()
-        new_width = int(screen_size.width() * 3 / 5)
-        new_height = int(screen_size.height() * 3 / 5)
+        new_width = screen_size.width() * 3 // 5
+        new_height = screen_size.height() * 3 // 5
         self.resize(new_width, new_height)
 
-        # If a folder path is provided, open it
+        # Set initial sizes for the splitter from the window width
+        self._main_splitter.setSizes(
+            [int(new_width * ratio) for ratio in (0.12, 0.25, 0.38, 0.25)]
+        )
+
+        # Global keybindings, see keyPressEvent
+        self._key_dispatch = {
+            int(Qt.Key.Key_W): self._directory_tree.navigate_to_previous_folder,
+            int(Qt.Key.Key_S): self._directory_tree.navigate_to_next_folder,
+            int(Qt.Key.Key_A): self._on_previous_clicked,
+            int(Qt.Key.Key_D): self._on_next_clicked,
+            int(Qt.Key.Key_R): self._image_viewer.normalSize,
+            int(Qt.Key.Key_1): self._image_viewer.fullSize,
+            int(Qt.Key.Key_X): self._on_mark_file_clicked,
+        }
+
+        # If a folder path is provided open it, otherwise reopen the root
+        # folder from the last session
+        if not folder_path:
+            folder_path = self._load_state().get("last_root")
         if folder_path:
             self._open_root_folder_from_path(folder_path)
 
+    def _load_state(self) -> dict:
+        """Load the viewer state saved by the last session.
+
+        Returns:
+            dict: The saved state, empty if there is none or it can't be read.
+        """
+        try:
+            with open(_STATE_PATH, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Error reading viewer state {_STATE_PATH}: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_state(self) -> None:
+        """Save the viewer state for the next session."""
+        state = {"last_root": self._directory_tree.get_root_folder()}
+        tmp_path = _STATE_PATH + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(_STATE_PATH), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            # Replace the old state in one step so it is never half written
+            os.replace(tmp_path, _STATE_PATH)
+        except OSError as e:
+            print(f"Error saving viewer state {_STATE_PATH}: {e}")
+
+    def closeEvent(self, event):
+        """Save the viewer state when the window closes.
+
+        Args:
+            event: QCloseEvent
+        """
+        self._save_state()
+        super().closeEvent(event)
+
     def _create_menu_bar(self):
         """Create the menu bar with File menu and actions."""
         menu_bar = self.menuBar()
@@ -267,13 +315,13 @@ class ViewMain(QMainWindow):
 
         # Create Open Folder action
         open_folder_action = QAction("Open Folder", self)
-        open_folder_action.setShortcut("Ctrl+O")
+        open_folder_action.setShortcut(QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_O))
         open_folder_action.triggered.connect(self._open_root_folder)
         main_menu.addAction(open_folder_action)
 
         # Create Refresh action
         refresh_action = QAction("Refresh", self)
-        refresh_action.setShortcut("F5")
+        refresh_action.setShortcut(QKeySequence(Qt.Key.Key_F5))
         refresh_action.triggered.connect(self._refresh_current_folder)
         main_menu.addAction(refresh_action)
 
@@ -282,13 +330,13 @@ class ViewMain(QMainWindow):
 
         # Create Delete Marked Files action
         delete_marked_action = QAction("Delete Marked Files", self)
-        delete_marked_action.setShortcut("Ctrl+D")
+        delete_marked_action.setShortcut(QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_D))
         delete_marked_action.triggered.connect(self._delete_marked_files)
         main_menu.addAction(delete_marked_action)
 
         # Create Prune Empty Directories action
         prune_action = QAction("Prune Empty Directories", self)
-        prune_action.setShortcut("Ctrl+P")
+        prune_action.setShortcut(QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_P))
         prune_action.triggered.connect(self._prune_empty_directories_action)
         main_menu.addAction(prune_action)
 
@@ -297,13 +345,15 @@ class ViewMain(QMainWindow):
 
         # Create Keybindings action
         keybindings_action = QAction("Keybindings", self)
-        keybindings_action.setShortcut("Ctrl+K")
+        keybindings_action.setShortcut(QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_K))
         keybindings_action.triggered.connect(self._show_keybindings)
         main_menu.addAction(keybindings_action)
 
         # Create Compact View action
         compact_view_action = QAction("Compact View", self)
-        compact_view_action.setShortcut("Ctrl+Shift+C")
+        compact_view_action.setShortcut(
+            QKeySequence(Qt.Modifier.CTRL | Qt.Modifier.SHIFT | Qt.Key.Key_C)
+        )
         compact_view_action.triggered.connect(self._set_compact_view)
         main_menu.addAction(compact_view_action)
 
@@ -312,14 +362,20 @@ class ViewMain(QMainWindow):
 
         # Create Exit action
         exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
+        exit_action.setShortcut(QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_Q))
         exit_action.triggered.connect(self.close)
         main_menu.addAction(exit_action)
 
     def _show_keybindings(self):
-        """Show the keybindings dialog."""
-        dialog = KeybindingsDialog(self)
-        dialog.exec()
+        """Show the keybindings dialog, creating it on first use."""
+        if self._keybindings_dialog is None:
+            # Imported here, most sessions never open the dialog
+            from .keybindingsdialog import KeybindingsDialog
+
+            self._keybindings_dialog = KeybindingsDialog(self)
+        self._keybindings_dialog.show()
+        self._keybindings_dialog.raise_()
+        self._keybindings_dialog.activateWindow()
 
     def set_status_message(self, message: str):
         """Update the status label with a message.
@@ -337,14 +393,40 @@ class ViewMain(QMainWindow):
         # Set splitter sizes to 200, 220, 580, 290
         self._main_splitter.setSizes([200, 220, 580, 290])
 
+    def _show_message(self, icon, title: str, text: str, buttons):
+        """Show a message in the shared message box and wait for an answer.
+
+        Args:
+            icon: QMessageBox.Icon to show.
+            title (str): Window title.
+            text (str): Message text.
+            buttons: QMessageBox.StandardButton flags to offer.
+
+        Returns:
+            QMessageBox.StandardButton: The button the user chose.
+        """
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+        message_box = self._message_box
+        message_box.setIcon(icon)
+        message_box.setWindowTitle(title)
+        message_box.setText(text)
+        message_box.setStandardButtons(buttons)
+        message_box.exec()
+        return message_box.standardButton(message_box.clickedButton())
+
     def _prune_empty_directories_action(self):
         """Handle Prune Empty Directories menu action."""
+        # Only one prune runs at a time
+        if self._prune_progress is not None:
+            return
+
         # Get the current root folder from the file system model
         root_path = self._directory_tree.get_root_folder()
 
         if not root_path or not os.path.isdir(root_path):
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Warning,
                 "No Folder Selected",
                 "Please select a folder first.",
                 QMessageBox.StandardButton.Ok,
@@ -352,8 +434,8 @@ class ViewMain(QMainWindow):
             return
 
         # Confirm with user
-        confirm = QMessageBox.question(
-            self,
+        confirm = self._show_message(
+            QMessageBox.Icon.Question,
             "Confirm Prune Empty Directories",
             f"Are you sure you want to remove all empty directories below:\n{root_path}?\n\n"
             + "This action cannot be undone.",
@@ -361,29 +443,51 @@ class ViewMain(QMainWindow):
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            # Prune empty directories
-            removed_count = self._directory_tree.prune_empty_directories(root_path)
-
-            # Show result message
-            QMessageBox.information(
-                self,
-                "Directories Pruned",
-                f"Successfully removed {removed_count} empty directory(ies).",
-                QMessageBox.StandardButton.Ok,
+            # Prune empty directories on a worker thread, large trees can take
+            # a while to walk
+            self._prune_progress = QProgressDialog(
+                "Removing empty directories...", "", 0, 0, self
             )
+            self._prune_progress.setWindowTitle("Pruning Directories")
+            self._prune_progress.setCancelButton(None)
+            self._prune_progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._prune_progress.setMinimumDuration(0)
+            self._prune_progress.show()
+
+            job = PruneJob(self._directory_tree, root_path)
+            job.signals.finished.connect(self._on_prune_finished)
+            QThreadPool.globalInstance().start(job)
+
+    def _on_prune_finished(self, root_path: str, removed_count: int) -> None:
+        """Report the result of a PruneJob and refresh the tree."""
+        if self._prune_progress is not None:
+            self._prune_progress.close()
+            self._prune_progress.deleteLater()
+            self._prune_progress = None
+
+        # Show result message
+        self._show_message(
+            QMessageBox.Icon.Information,
+            "Directories Pruned",
+            f"Successfully removed {removed_count} empty directory(ies).",
+            QMessageBox.StandardButton.Ok,
+        )
 
-            # Refresh the directory tree
-            if root_path:
-                self._directory_tree.open_root_folder(root_path)
+        # Refresh the directory tree
+        self._directory_tree.open_root_folder(root_path)
 
     def _open_root_folder(self):
         """Open a file dialog to select a folder."""
-        folder_path = QFileDialog.getExistingDirectory(
+        folder_url = QFileDialog.getExistingDirectoryUrl(
             self,
             "Select Folder",
-            "",
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks,
+            QUrl(),
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons,
+            ["file"],
         )
+        folder_path = folder_url.toLocalFile() if folder_url.isValid() else ""
         if folder_path:
             self._open_root_folder_from_path(folder_path)
 
@@ -391,27 +495,45 @@ class ViewMain(QMainWindow):
         """Refresh the current folder by reloading it and reading its contents."""
         # Get the current root folder
         root_path = self._directory_tree.get_root_folder()
+        if not root_path:
+            return
 
-        if root_path:
-            # Re-open the root folder to refresh the directory tree
-            self._open_root_folder_from_path(root_path)
+        # A second F5 right after the first has nothing new to show
+        now = time.monotonic()
+        if now - self._last_refresh_time < 0.5:
+            return
+        self._last_refresh_time = now
 
-            # Re-read the current folder contents
-            if self._last_file_path:
-                self.read_folder(self._last_file_path)
+        # Re-open the root folder to refresh the directory tree, this selects
+        # the root folder again
+        if not self._open_root_folder_from_path(root_path):
+            return
+
+        # Re-read the root folder contents once, rather than through the
+        # folder click as well
+        self._load_timer.stop()
+        self._pending_folder = None
+        self._last_file_path = self._directory_tree.get_selected_folder_path()
+        if self._last_file_path:
+            self.read_folder(self._last_file_path)
 
-    def _open_root_folder_from_path(self, folder_path: str) -> None:
+    def _open_root_folder_from_path(self, folder_path: str) -> bool:
         """Open a folder from a given path.
 
         Args:
             folder_path (str): Path to the folder to open.
+
+        Returns:
+            bool: True if the folder was opened, False if it isn't a directory.
         """
-        # Check if the path is a valid directory
-        if os.path.isdir(folder_path):
-            # Set the window title to show the folder path
-            self.setWindowTitle(f"bowser-view - {folder_path}")
-            # Use the directory tree's method to open the folder
-            self._directory_tree.open_root_folder(folder_path)
+        # Use the directory tree's method to open the folder, it checks that
+        # the path is a valid directory
+        if not self._directory_tree.open_root_folder(folder_path):
+            return False
+
+        # Set the window title to show the folder path
+        self.setWindowTitle(f"bowser-view - {folder_path}")
+        return True
 
     def _on_folder_clicked(self, index) -> None:
         """Handle folder click event and invoke read_folder callback.
@@ -422,13 +544,28 @@ class ViewMain(QMainWindow):
         Args:
             index: The model index of the clicked folder.
         """
-        if index.isValid():
-            # Get the file path from the model
-            file_path = self._directory_tree.get_folder_path_from_index(index)
-            if self._last_file_path != file_path:
-                # Invoke the read_folder callback with the folder path
-                self._last_file_path = file_path
-                self.read_folder(file_path)
+        if not index.isValid():
+            return
+
+        file_path = self._directory_tree.get_folder_path_from_index(index)
+        if file_path == self._last_file_path:
+            # Back on the folder already shown, drop any folder still pending
+            self._load_timer.stop()
+            self._pending_folder = None
+        else:
+            # Load the folder once the clicks settle down
+            self._pending_folder = file_path
+            self._load_timer.start()
+
+    def _flush_pending_folder(self) -> None:
+        """Load the last clicked folder if it isn't already loaded."""
+        self._load_timer.stop()
+        file_path = self._pending_folder
+        self._pending_folder = None
+        if file_path and self._last_file_path != file_path:
+            # Invoke the read_folder callback with the folder path
+            self._last_file_path = file_path
+            self.read_folder(file_path)
 
     def read_folder(self, folder_path: str) -> None:
         """Callback method to be invoked when a folder is clicked.
@@ -442,8 +579,23 @@ class ViewMain(QMainWindow):
         Note:
             Only files with supported extensions (as defined in utils.py) will be loaded.
         """
-        # Load images from the selected folder into the gallery
-        self._image_gallery.load_images_from_folder(folder_path)
+        # List the folder on a worker thread, large or remote folders can take
+        # a while, and load the gallery when the listing arrives
+        job = FolderScanJob(folder_path)
+        job.signals.scanned.connect(self._on_folder_scanned)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_folder_scanned(self, folder_path: str, image_paths: list) -> None:
+        """Load a scanned folder into the gallery if it is still current."""
+        # The user may have moved on while the folder was being listed
+        if folder_path != self._last_file_path:
+            return
+
+        self._image_gallery.load_images_from_list(image_paths)
+
+        if self._pending_show_file:
+            self._image_gallery.show_image(self._pending_show_file)
+            self._pending_show_file = None
 
     def _on_input_file_selected(self, file_path: str) -> None:
         """Handle input file selection event.
@@ -463,7 +615,13 @@ class ViewMain(QMainWindow):
             # get the path up to the filename and load that folder in the gallery, which will also select the file
             folder_path = os.path.dirname(file_path)
             self._directory_tree.select_folder(folder_path)
-            self._image_gallery.show_image(file_path)
+            # The gallery needs the folder loaded to show the file, if it
+            # isn't there yet show it once the folder has been scanned
+            self._flush_pending_folder()
+            if self._image_gallery.show_image(file_path):
+                self._pending_show_file = None
+            else:
+                self._pending_show_file = file_path
         else:
             # Load and display file metadata
             self._metadata_display.load_file_metadata(file_path)
@@ -511,19 +669,27 @@ class ViewMain(QMainWindow):
         Args:
             event: QDropEvent
         """
-        # Get the URLs from the drop event
-        urls = event.mimeData().urls()
-        if urls:
-            # Get the first URL's local path
-            folder_path = urls[0].toLocalFile()
-
-            # Check if it's a valid directory
-            if os.path.isdir(folder_path):
-                # Open the folder
-                self._open_root_folder_from_path(folder_path)
-                event.acceptProposedAction()
-            else:
-                event.ignore()
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            event.ignore()
+            return
+
+        # Only the first URL is used, so take it from the raw uri list rather
+        # than converting every dropped URL
+        folder_path = ""
+        for line in bytes(mime_data.data("text/uri-list")).splitlines():
+            line = line.strip()
+            if line and not line.startswith(b"#"):
+                folder_path = QUrl.fromEncoded(line).toLocalFile()
+                break
+        else:
+            urls = mime_data.urls()
+            if urls:
+                folder_path = urls[0].toLocalFile()
+
+        # Open the folder if it's a valid directory
+        if folder_path and self._open_root_folder_from_path(folder_path):
+            event.acceptProposedAction()
         else:
             event.ignore()
 
@@ -542,53 +708,21 @@ class ViewMain(QMainWindow):
         Args:
             event: QKeyEvent containing the key press information.
         """
-        if event.key() == Qt.Key.Key_W:
-            self._directory_tree.navigate_to_previous_folder()
-        elif event.key() == Qt.Key.Key_S:
-            self._directory_tree.navigate_to_next_folder()
-        elif event.key() == Qt.Key.Key_A:
-            self._on_previous_clicked()
-        elif event.key() == Qt.Key.Key_D:
-            self._on_next_clicked()
-        elif event.key() == Qt.Key.Key_R:
-            self._image_video_viewer.get_image_viewer().normalSize()
-        elif event.key() == Qt.Key.Key_1:
-            self._image_video_viewer.get_image_viewer().fullSize()
-        elif event.key() == Qt.Key.Key_X:
-            self._on_mark_file_clicked()
+        handler = self._key_dispatch.get(event.key())
+        if handler:
+            handler()
+        else:
+            super().keyPressEvent(event)
 
     def _apply_dark_mode(self):
         """Apply dark mode using Fusion style with custom dark palette."""
-        # Set Fusion style
-        QApplication.setStyle(QStyleFactory.create("Fusion"))
-
-        # Create dark palette
-        dark_palette = QPalette()
-
-        # Base colors
-        dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-        dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-        dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-
-        # Disabled colors
-        dark_palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(128, 128, 128)
-        )
-        dark_palette.setColor(
-            QPalette.ColorGroup.Disabled,
-            QPalette.ColorRole.ButtonText,
-            QColor(128, 128, 128),
-        )
+        global _DARK_PALETTE
+
+        # Set Fusion style, unless an earlier window already did
+        if QApplication.style().name().lower() != "fusion":
+            QApplication.setStyle(QStyleFactory.create("Fusion"))
 
-        # Apply the palette
-        QApplication.setPalette(dark_palette)
+        # Apply the palette, built the first time it is needed
+        if _DARK_PALETTE is None:
+            _DARK_PALETTE = _build_dark_palette()
+        QApplication.setPalette(_DARK_PALETTE)
@@ -29,6 +29,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .thumbnailcache import (
+    load_cached_thumbnail,
+    save_cached_thumbnail,
+    thumbnail_cache_path,
+    trim_thumbnail_cache,
+)
 from .utils import (
     ALL_SUPPORTED_EXTENSIONS,
     MAX_PROCESSES,
@@ -36,7 +42,6 @@ from .utils import (
     get_swarm_json_path,
     get_swarm_preview_path,
     is_video_file,
-    safe_remove_file,
 )
 
 
@@ -144,18 +149,28 @@ def load_image_worker(
     try:
         from PIL import Image
 
-        # Load the image
-        thumbnail_path = image_path
         # if there is a swarmpreview for the file then use it for the pixmap
-        swarm_preview_path = get_swarm_preview_path(image_path)
-        if os.path.exists(swarm_preview_path):
-            thumbnail_path = swarm_preview_path
+        thumbnail_path = get_swarm_preview_path(image_path)
+        try:
+            stat_result = os.stat(thumbnail_path)
+        except FileNotFoundError:
+            thumbnail_path = image_path
+            stat_result = os.stat(image_path)
 
+        # Reuse the thumbnail from an earlier load of the same file
+        cache_path = thumbnail_cache_path(thumbnail_path, stat_result, thumbnail_size)
+        cached_image = load_cached_thumbnail(cache_path)
+        if cached_image is not None:
+            return (image_path, cached_image, cached_image.size, index)
+
+        # Load the image
         image = Image.open(thumbnail_path)
 
         if image:
             image.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
-            return (image_path, image.convert("RGB"), image.size, index)
+            image = image.convert("RGB")
+            save_cached_thumbnail(cache_path, image)
+            return (image_path, image, image.size, index)
         else:
             return (image_path, None, (0, 0), index)
     except Exception as e:
@@ -163,6 +178,33 @@ def load_image_worker(
         return (image_path, None, (0, 0), index)
 
 
+def list_folder_images(folder_path: str) -> List[str]:
+    """List the supported image and video files in a folder.
+
+    Swarm preview images and bowser-temp files are left out. Entry types come
+    from the directory listing, so files aren't stat'ed one by one.
+
+    Args:
+        folder_path (str): Path to the folder to list.
+
+    Returns:
+        list: Paths of the supported files in the folder.
+    """
+    supported_extensions = ALL_SUPPORTED_EXTENSIONS
+    image_paths = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            file_name = entry.name
+            # exclude .swarmpreview images and bowser-temp images
+            if ".swarmpreview.jpg" in file_name or "bowser-temp" in file_name:
+                continue
+            if os.path.splitext(file_name)[1].lower() not in supported_extensions:
+                continue
+            if entry.is_file():
+                image_paths.append(os.path.join(folder_path, file_name))
+    return image_paths
+
+
 class ImageGallery(QWidget):
     """A widget that displays thumbnails of images and videos in a folder.
 
@@ -199,6 +241,11 @@ class ImageGallery(QWidget):
         self._reverse_order = False
         # self.setStyleSheet("color: gray;")
         self._process_pool = None
+        # The thumbnail cache is trimmed once per session, after a load
+        self._thumbnail_cache_trimmed = False
+        # Display position of the thumbnail in the middle of the viewport,
+        # thumbnails closest to it are loaded first
+        self._viewport_center = 0
         self._setup_ui()
 
     def _cleanup_process_pool(self):
@@ -250,6 +297,11 @@ class ImageGallery(QWidget):
         self._scroll_area.setWidget(self._content_widget)
         main_layout.addWidget(self._scroll_area)
 
+        # Track the viewport so thumbnails load around what is on screen
+        self._scroll_area.verticalScrollBar().valueChanged.connect(
+            self._update_viewport_center
+        )
+
     def add_image(self, file_path: str) -> None:
         # Get all supported files from the folder
         supported_extensions = ALL_SUPPORTED_EXTENSIONS
@@ -282,19 +334,18 @@ class ImageGallery(QWidget):
         Args:
             folder_path (str): Path to the folder containing images and videos.
         """
-        self._image_paths = []
+        self.load_images_from_list(list_folder_images(folder_path))
 
-        # Get all supported files from the folder
-        supported_extensions = ALL_SUPPORTED_EXTENSIONS
+    def load_images_from_list(self, image_paths: List[str]) -> None:
+        """Load and display the given images and videos.
 
-        for file_name in os.listdir(folder_path):
-            # exclude .swarmpreview images and bowser-temp images
-            if ".swarmpreview.jpg" not in file_name and "bowser-temp" not in file_name:
-                file_path = os.path.join(folder_path, file_name)
-                if os.path.isfile(file_path):
-                    ext = os.path.splitext(file_name)[1].lower()
-                    if ext in supported_extensions:
-                        self._image_paths.append(file_path)
+        Use this with list_folder_images to scan a folder away from the GUI
+        thread and only build the thumbnails here.
+
+        Args:
+            image_paths (list): Paths of the image and video files to show.
+        """
+        self._image_paths = list(image_paths)
 
         # Clear existing thumbnails and recreate with new layout
         self._clear_thumbnails()
@@ -303,7 +354,9 @@ class ImageGallery(QWidget):
             self._build_thumbnails()
             self._display_thumbnails()
             self._show_first_visible_thumbnail()
-            # Load thumbnails in parallel using multiprocessing
+            # Load thumbnails in parallel using multiprocessing, starting
+            # with the ones on screen
+            self._update_viewport_center()
             if self._thread:
                 self._request_load_cancel = True
                 self._thread.join()
@@ -394,28 +447,55 @@ class ImageGallery(QWidget):
         self._process_pool = Pool(processes=num_processes)
 
         try:
-            # process tasks in chunks
+            # process tasks in chunks, each chunk taking the thumbnails
+            # closest to the viewport so loading follows scrolling
             chunk_size = PROCESSING_CHUNK_SIZE
-            for i in range(0, len(self._image_paths), chunk_size):
-                if not self._request_load_cancel:
-                    chunk = self._image_paths[i : i + chunk_size]
-                    # Submit tasks to the process pool
-                    results = []
-                    for j, image_path in enumerate(chunk):
-                        result = self._process_pool.apply_async(
-                            load_image_worker,
-                            args=(image_path, self._thumbnail_size, i + j),
-                        )
-                        results.append(result)
-
-                    # Process results as they become available
-                    for result in results:
-                        image_path, resized_image, size, index = result.get()
-                        self._set_thumbnail(resized_image, size, index)
+            image_paths = self._image_paths
+            count = len(image_paths)
+            pending = list(range(count))
+            last_center = None
+            while pending and not self._request_load_cancel:
+                center = self._viewport_center
+                if center != last_center:
+                    last_center = center
+                    if self._reverse_order:
+                        pending.sort(key=lambda i: abs(count - 1 - i - center))
+                    else:
+                        pending.sort(key=lambda i: abs(i - center))
+                chunk = pending[:chunk_size]
+                del pending[:chunk_size]
+
+                # Submit tasks to the process pool
+                results = []
+                for index in chunk:
+                    result = self._process_pool.apply_async(
+                        load_image_worker,
+                        args=(image_paths[index], self._thumbnail_size, index),
+                    )
+                    results.append(result)
+
+                # Process results as they become available
+                for result in results:
+                    image_path, resized_image, size, index = result.get()
+                    self._set_thumbnail(resized_image, size, index)
         finally:
             # Ensure cleanup happens even if there's an exception
             self._cleanup_process_pool()
 
+        # Keep the disk cache within its size limit, this runs on the
+        # loading thread so it doesn't hold up the gallery
+        if not self._thumbnail_cache_trimmed:
+            self._thumbnail_cache_trimmed = True
+            trim_thumbnail_cache()
+
+    def _update_viewport_center(self, *args) -> None:
+        """Record which thumbnail is in the middle of the viewport."""
+        row_height = self._thumbnail_size[1] + self._content_layout.spacing()
+        columns = max(1, self._current_columns)
+        viewport_height = self._scroll_area.viewport().height()
+        center_y = self._scroll_area.verticalScrollBar().value() + viewport_height // 2
+        self._viewport_center = (center_y // max(1, row_height)) * columns + columns // 2
+
     def _display_thumbnails(self):
         """Display thumbnails for all loaded images."""
         if not self._image_paths:
@@ -439,20 +519,26 @@ class ImageGallery(QWidget):
             image_paths_iter = self._image_paths
             widget_iter = self._thumbnail_widgets
 
-        count = 0
-        for i, (image_path, widget) in enumerate(zip(image_paths_iter, widget_iter)):
-            self._content_layout.removeWidget(widget)
-            if (
-                filter_lower is None
-                or filter_lower in os.path.basename(image_path).lower()
-            ):
-                row = count // columns
-                col = count % columns
-                self._content_layout.addWidget(widget, row, col)
-                widget.show()
-                count += 1
-            else:
-                widget.hide()
+        # Place all the thumbnails before the grid is repainted, rather than
+        # repainting as each one moves
+        self._content_widget.setUpdatesEnabled(False)
+        try:
+            count = 0
+            for image_path, widget in zip(image_paths_iter, widget_iter):
+                self._content_layout.removeWidget(widget)
+                if (
+                    filter_lower is None
+                    or filter_lower in os.path.basename(image_path).lower()
+                ):
+                    row = count // columns
+                    col = count % columns
+                    self._content_layout.addWidget(widget, row, col)
+                    widget.show()
+                    count += 1
+                else:
+                    widget.hide()
+        finally:
+            self._content_widget.setUpdatesEnabled(True)
 
     def _on_filter_text_changed(self, text: str) -> None:
         """Handle filter text changed event.
@@ -725,43 +811,55 @@ class ImageGallery(QWidget):
             # List to store moved widgets and their paths
             moved_widgets = []
 
-            for file_path in self._marked_files[:]:  # Use slice to iterate over a copy
-                try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                        deleted_count += 1
+            # Look up gallery positions once rather than searching the path
+            # list for every deleted file
+            path_indices = {path: i for i, path in enumerate(self._image_paths)}
+            # Files that failed to delete stay marked
+            still_marked = []
 
-                        # Remove any matching .swarm.json and .swarmpreview.jpg files
-                        swarm_json_path = get_swarm_json_path(file_path)
-                        if os.path.exists(swarm_json_path):
-                            if safe_remove_file(swarm_json_path):
-                                deleted_count += 1
-
-                        # Remove .swarmpreview.jpg file if it exists
-                        swarm_preview_path = get_swarm_preview_path(file_path)
-                        if os.path.exists(swarm_preview_path):
-                            if safe_remove_file(swarm_preview_path):
-                                deleted_count += 1
-
-                        # Find the index of this file in _image_paths
-                        if file_path in self._image_paths:
-                            index = self._image_paths.index(file_path)
-                            indices_to_remove.append(index)
-
-                        # Remove from marked files list
-                        self._marked_files.remove(file_path)
-                    else:
-                        print(f"Warning: File not found during deletion: {file_path}")
-                        self._marked_files.remove(file_path)
+            for file_path in self._marked_files:
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    print(f"Warning: File not found during deletion: {file_path}")
+                    continue
                 except PermissionError as e:
                     print(f"Permission error deleting {file_path}: {e}")
                     error_count += 1
+                    still_marked.append(file_path)
+                    continue
                 except OSError as e:
                     print(f"OS error deleting {file_path}: {e}")
                     error_count += 1
+                    still_marked.append(file_path)
+                    continue
                 except Exception as e:
                     print(f"Unexpected error deleting {file_path}: {e}")
                     error_count += 1
+                    still_marked.append(file_path)
+                    continue
+                deleted_count += 1
+
+                # Remove any matching .swarm.json and .swarmpreview.jpg files,
+                # most files don't have them so just try removing them
+                for swarm_path in (
+                    get_swarm_json_path(file_path),
+                    get_swarm_preview_path(file_path),
+                ):
+                    try:
+                        os.remove(swarm_path)
+                        deleted_count += 1
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        print(f"Error removing {swarm_path}: {e}")
+
+                # Find the index of this file in _image_paths
+                index = path_indices.get(file_path)
+                if index is not None:
+                    indices_to_remove.append(index)
+
+            self._marked_files[:] = still_marked
 
             # Move deleted widgets to the end of the list instead of deleting them
             # This saves the overhead of recreating them later
@@ -11,8 +11,10 @@ os.environ["QT_LOGGING_RULES"] = "*.debug=false;qt.multimedia.*=false"
 
 from PIL.Image import Image as PILImage
 from PIL.ImageQt import ImageQt
-from PySide6.QtCore import QPointF, Qt, Slot
+from PySide6.QtCore import QObject, QPointF, QRunnable, Qt, QThreadPool, Signal, Slot
 from PySide6.QtGui import (
+    QImage,
+    QImageReader,
     QMovie,
     QPainter,
     QPalette,
@@ -30,6 +32,30 @@ from PySide6.QtWidgets import (
 )
 
 
+class ImageDecoderSignals(QObject):
+    """Signals emitted by an ImageDecoder."""
+
+    # image path, decoded image (null if it could not be read)
+    decoded = Signal(str, QImage)
+
+
+class ImageDecoder(QRunnable):
+    """Decode an image file on a worker thread.
+
+    QImage can be used off the GUI thread, only the QPixmap made from it has
+    to be created on the GUI thread.
+    """
+
+    def __init__(self, image_path):
+        super().__init__()
+        self.image_path = image_path
+        self.signals = ImageDecoderSignals()
+
+    def run(self):
+        image = QImageReader(self.image_path).read()
+        self.signals.decoded.emit(self.image_path, image)
+
+
 class ImageViewer(QWidget):
     """A widget for displaying and manipulating images with zoom and pan capabilities.
 
@@ -52,6 +78,8 @@ class ImageViewer(QWidget):
 
         self._movie: Optional[QMovie] = None
         self._image: Optional[Union[QPixmap, QGraphicsProxyWidget]] = None
+        # Image file being decoded on a worker thread
+        self._decoding_path: Optional[str] = None
 
         self._transform = QTransform()
         self._image_view = QGraphicsView()
@@ -108,26 +136,47 @@ class ImageViewer(QWidget):
         Args:
             new_image (str): Path to the image file to load.
         """
+        # Decode still images on a worker thread, the current image stays up
+        # until the new one is ready
+        if os.path.splitext(new_image)[1].lower() != ".webp":
+            self._decoding_path = new_image
+            decoder = ImageDecoder(new_image)
+            decoder.signals.decoded.connect(self._on_image_decoded)
+            QThreadPool.globalInstance().start(decoder)
+            return
+
         # clear any existing
         self.clear()
 
         # assume webp is animated
-        if os.path.splitext(new_image)[1].lower() == ".webp":
-            gif_anim = QLabel()
-            self._movie = QMovie(new_image)
-
-            gif_anim.setMovie(self._movie)
-            self._movie.start()
-            self._image = self._image_scene.addWidget(gif_anim)
-        else:
-            self._image = QPixmap(new_image)
-            if not self._image.isNull():
-                self._image_scene.addPixmap(self._image)
+        gif_anim = QLabel()
+        self._movie = QMovie(new_image)
+
+        gif_anim.setMovie(self._movie)
+        self._movie.start()
+        self._image = self._image_scene.addWidget(gif_anim)
+
+        self._image_view.setVisible(True)
+        self.normalSize()
+
+    def _on_image_decoded(self, image_path: str, image: QImage) -> None:
+        """Display an image decoded by an ImageDecoder."""
+        # Ignore images that were replaced while they were decoding
+        if image_path != self._decoding_path:
+            return
+
+        # clear any existing
+        self.clear()
+
+        self._image = QPixmap.fromImage(image)
+        if not self._image.isNull():
+            self._image_scene.addPixmap(self._image)
 
         self._image_view.setVisible(True)
         self.normalSize()
 
     def clear(self):
+        self._decoding_path = None
         if self._image and isinstance(self._image, QPixmap):
             self._image_scene.clear()
             self._image = None
@@ -41,6 +41,12 @@ class MetadataHandler:
         },
     }
 
+    # Alternative metadata keys to try when a title has no direct match
+    key_aliases: Dict[str, str] = {
+        "cfg": "cfgscale",
+        "initimage": "initimage_filename",
+    }
+
     def __init__(self) -> None:
         """Initialize the MetadataHandler."""
         # Build values_to_extract from field_config keys
@@ -76,22 +82,49 @@ class MetadataHandler:
     def find_metadata_for_key(
         cls, input_key: str, values: Dict[str, Any]
     ) -> Optional[Any]:
-        key = input_key.lower().replace(" ", "")
+        key = cls.normalize_key(input_key)
 
-        # Try to match metadata values to node widgets
         # First, try exact title match
         if key in values:
             return values[key]
 
-        # Try alternative matches based on common field names
-        if key == "cfg" and "cfgscale" in values:
-            return values["cfgscale"]
-
-        if key == "initimage" and "initimage_filename" in values:
-            return values["initimage_filename"]
+        # Then try the alternative metadata key for common field names
+        alias = cls.key_aliases.get(key)
+        if alias is not None and alias in values:
+            return values[alias]
 
         return None
 
+    @staticmethod
+    def normalize_key(key: Any) -> str:
+        """Normalize a title or metadata key for matching."""
+        return str(key).lower().replace(" ", "")
+
+    @classmethod
+    def build_metadata_index(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a lookup of normalized keys for matching many titles at once.
+
+        Keys are lowercased with spaces removed, with keys that are already
+        normalized taking precedence, and the key aliases folded in so each
+        title can be resolved with a single dictionary lookup.
+
+        Args:
+            values: Flattened metadata values
+
+        Returns:
+            dict: Metadata values keyed by their normalized key.
+        """
+        index: Dict[str, Any] = {}
+        for key, value in values.items():
+            index.setdefault(cls.normalize_key(key), value)
+        for key, value in values.items():
+            if key == cls.normalize_key(key):
+                index[key] = value
+        for key, alias in cls.key_aliases.items():
+            if key not in index and alias in index:
+                index[key] = index[alias]
+        return index
+
     def load_file_metadata(self, file_path: str) -> Dict[str, Any]:
         """Load and process metadata from an image or video file.
 
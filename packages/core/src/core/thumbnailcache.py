@@ -0,0 +1,126 @@
+"""Disk cache for gallery thumbnails.
+
+Thumbnails are stored as small JPEG files keyed by the source file's path,
+modification time, size and the thumbnail size, so reopening a folder can
+skip decoding the full images. A changed source file gets a new key, and
+old entries are trimmed once the cache grows past its size limit.
+"""
+
+import hashlib
+import os
+from typing import Any, Optional, Tuple
+
+THUMBNAIL_CACHE_DIR: str = os.path.join(
+    os.path.expanduser("~/.cache"), "bowser", "thumbs"
+)
+THUMBNAIL_CACHE_MAX_BYTES: int = 500 * 1024 * 1024
+
+
+def thumbnail_cache_path(
+    source_path: str, stat_result: os.stat_result, thumbnail_size: Tuple[int, int]
+) -> str:
+    """Get the cache file path for a thumbnail.
+
+    Args:
+        source_path (str): Path to the file the thumbnail is made from.
+        stat_result (os.stat_result): Result of os.stat on the source file.
+        thumbnail_size (tuple): Size of the thumbnail (width, height).
+
+    Returns:
+        str: Path of the cached thumbnail, which may not exist yet.
+    """
+    key = (
+        f"{source_path}|{stat_result.st_mtime_ns}|{stat_result.st_size}"
+        f"|{thumbnail_size[0]}x{thumbnail_size[1]}"
+    )
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(THUMBNAIL_CACHE_DIR, digest[:2], f"{digest}.jpg")
+
+
+def load_cached_thumbnail(cache_path: str) -> Optional[Any]:
+    """Load a cached thumbnail.
+
+    Args:
+        cache_path (str): Path from thumbnail_cache_path.
+
+    Returns:
+        PIL.Image or None: The RGB thumbnail, or None if it isn't cached.
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(cache_path) as image:
+            return image.convert("RGB")
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error reading cached thumbnail {cache_path}: {e}")
+        return None
+
+
+def save_cached_thumbnail(cache_path: str, image: Any) -> None:
+    """Save a thumbnail to the cache.
+
+    The file is written under a temporary name and moved into place, so
+    other processes never read a partly written thumbnail.
+
+    Args:
+        cache_path (str): Path from thumbnail_cache_path.
+        image (PIL.Image): The RGB thumbnail to save.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        image.save(tmp_path, "JPEG", quality=90)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        print(f"Error caching thumbnail {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def trim_thumbnail_cache(max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES) -> int:
+    """Remove the oldest cached thumbnails until the cache fits in max_bytes.
+
+    Args:
+        max_bytes (int): Largest total size the cache may have.
+
+    Returns:
+        int: Number of thumbnails removed.
+    """
+    entries = []
+    total_size = 0
+    try:
+        with os.scandir(THUMBNAIL_CACHE_DIR) as subdirs:
+            for subdir in subdirs:
+                if not subdir.is_dir():
+                    continue
+                with os.scandir(subdir.path) as files:
+                    for entry in files:
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+                        total_size += st.st_size
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        print(f"Error scanning thumbnail cache {THUMBNAIL_CACHE_DIR}: {e}")
+        return 0
+
+    removed_count = 0
+    if total_size > max_bytes:
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            removed_count += 1
+    return removed_count
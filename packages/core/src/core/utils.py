@@ -13,14 +13,16 @@ Key functionality:
 
 import os
 import time
-from typing import List, Tuple
+from typing import FrozenSet, Tuple
 
-# File format constants
-SUPPORTED_IMAGE_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp"]
+# File format constants, frozensets so membership checks are constant time
+SUPPORTED_IMAGE_EXTENSIONS: FrozenSet[str] = frozenset(
+    {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp"}
+)
 
-SUPPORTED_VIDEO_EXTENSIONS: List[str] = [".mp4", ".mov", ".avi", ".mkv", ".flv"]
+SUPPORTED_VIDEO_EXTENSIONS: FrozenSet[str] = frozenset({".mp4", ".mov", ".avi", ".mkv", ".flv"})
 
-ALL_SUPPORTED_EXTENSIONS: List[str] = SUPPORTED_IMAGE_EXTENSIONS + SUPPORTED_VIDEO_EXTENSIONS
+ALL_SUPPORTED_EXTENSIONS: FrozenSet[str] = SUPPORTED_IMAGE_EXTENSIONS | SUPPORTED_VIDEO_EXTENSIONS
 
 # Default values
 DEFAULT_THUMBNAIL_SIZE: Tuple[int, int] = (192, 192)